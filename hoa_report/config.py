@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -157,8 +159,16 @@ def _resolve_vendor_priority(
 
 
 def load_config(path: Path) -> InputConfig:
-    with path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    """Load and validate a run config; parses are cached until the file's mtime or size changes."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    # Callers get their own copy, so mutating a loaded config never leaks into the cache.
+    return copy.deepcopy(_load_config_cached(resolved, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path: Path, mtime_ns: int, size: int) -> InputConfig:
+    raw = json.loads(path.read_text(encoding="utf-8"))
 
     tape_path = Path(_require_str(raw, "tape_path"))
     template_path = Path(_require_str(raw, "template_path"))
@@ -199,6 +209,11 @@ def load_config(path: Path) -> InputConfig:
     )
 
 
+def clear_config_cache() -> None:
+    """Drop every config parsed by :func:`load_config`."""
+    _load_config_cached.cache_clear()
+
+
 def validate_paths(config: InputConfig) -> None:
     required_files = [config.tape_path, config.template_path, *(vendor.path for vendor in config.vendors)]
     if config.run_sql and config.sql is not None:
@@ -5,16 +5,18 @@ from dataclasses import dataclass
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from hoa_report.models import HOA_WIDE_CANONICAL_COLUMNS, enforce_hoa_extractor_columns
-from hoa_report.qa import normalize_loan_id
+from hoa_report.qa import normalize_loan_id_series
 
 _SOURCE_COLUMNS: tuple[str, str] = ("hoa_source", "hoa_source_file")
 _HOA_VALUE_COLUMNS: tuple[str, ...] = tuple(
     column for column in HOA_WIDE_CANONICAL_COLUMNS if column not in _SOURCE_COLUMNS
 )
 _NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_MONEY_SYMBOLS = r"[$,]"
 TEMPLATE_REPORT_COLUMNS: tuple[str, ...] = (
     "rwtLoanNo",
     "SEMT ID",
@@ -125,33 +127,44 @@ def _build_column_lookup(columns: Sequence[object]) -> dict[str, str]:
     return lookup
 
 
-def _select_first_matching_series(
+# Alias keys normalized once at import: (output column, candidate lookup keys in priority order).
+_TEMPLATE_FIELD_PLAN: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (output_column, tuple(dict.fromkeys(_normalize_column_key(alias) for alias in aliases)))
+    for output_column, aliases in _TEMPLATE_SOURCE_ALIASES.items()
+)
+
+
+def _select_first_matching_values(
     df: pd.DataFrame,
     column_lookup: dict[str, str],
-    candidates: Sequence[str],
-) -> pd.Series:
-    for candidate in candidates:
-        key = _normalize_column_key(candidate)
+    candidate_keys: Sequence[str],
+) -> Any:
+    """Return the backing array of the first candidate column present, or an all-None array."""
+    for key in candidate_keys:
         resolved = column_lookup.get(key)
         if resolved is not None:
-            return df[resolved].copy()
-    return pd.Series([None] * len(df), index=df.index, dtype=object)
+            return df[resolved].array
+    return np.full(len(df), None, dtype=object)
+
+
+def _to_money_numeric(values: pd.Series) -> pd.Series:
+    """Parse money text such as ``"$1,250.50"`` to floats; unparseable values become NaN."""
+    if values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+        try:
+            stripped = values.str.replace(_MONEY_SYMBOLS, "", regex=True).str.strip()
+        except AttributeError:
+            # No strings at all in this object column; to_numeric handles it directly.
+            pass
+        else:
+            values = stripped.where(stripped.notna(), values)
+    return pd.to_numeric(values, errors="coerce")
 
 
 def _derive_hoa_flag(hoa_monthly_payment: pd.Series) -> pd.Series:
-    cleaned_values = hoa_monthly_payment.copy()
-    if cleaned_values.dtype == object:
-        cleaned_values = cleaned_values.map(
-            lambda value: value.replace("$", "").replace(",", "").strip()
-            if isinstance(value, str)
-            else value
-        )
-    numeric_values = pd.to_numeric(cleaned_values, errors="coerce")
+    numeric_values = _to_money_numeric(hoa_monthly_payment).to_numpy(dtype="float64", na_value=np.nan)
 
-    hoa_flag = pd.Series([""] * len(hoa_monthly_payment), index=hoa_monthly_payment.index, dtype=object)
-    hoa_flag.loc[numeric_values > 0] = "Y"
-    hoa_flag.loc[numeric_values == 0] = "N"
-    return hoa_flag
+    hoa_flag = np.select([numeric_values > 0, numeric_values == 0], ["Y", "N"], default="").astype(object)
+    return pd.Series(hoa_flag, index=hoa_monthly_payment.index)
 
 
 def _first_non_blank(values: pd.Series) -> str | None:
@@ -163,12 +176,14 @@ def _first_non_blank(values: pd.Series) -> str | None:
 
 
 def _prepare_source(df: pd.DataFrame, original_index: int) -> _PreparedSource:
-    canonical_df = enforce_hoa_extractor_columns(df).copy()
-    canonical_df["loan_id"] = canonical_df["loan_id"].map(normalize_loan_id)
-    canonical_df = canonical_df.loc[canonical_df["loan_id"].notna()].copy()
-
-    if canonical_df["loan_id"].duplicated().any():
-        duplicates = sorted(canonical_df.loc[canonical_df["loan_id"].duplicated(), "loan_id"].unique())
+    # enforce_hoa_extractor_columns already returns a new frame, and boolean selection copies again.
+    canonical_df = enforce_hoa_extractor_columns(df)
+    canonical_df["loan_id"] = normalize_loan_id_series(canonical_df["loan_id"])
+    canonical_df = canonical_df.loc[canonical_df["loan_id"].notna()]
+
+    duplicate_mask = canonical_df["loan_id"].duplicated()
+    if duplicate_mask.any():
+        duplicates = sorted(canonical_df.loc[duplicate_mask, "loan_id"].unique())
         duplicate_summary = ", ".join(duplicates)
         raise ValueError(
             "merge_hoa_sources requires each vendor source to contain unique normalized "
@@ -236,7 +251,7 @@ def merge_hoa_sources(
         raise ValueError("merge_hoa_sources requires loan_master_df to contain 'loan_id'")
 
     merged_df = loan_master_df.copy()
-    merged_df["loan_id"] = merged_df["loan_id"].map(normalize_loan_id)
+    merged_df["loan_id"] = normalize_loan_id_series(merged_df["loan_id"])
     invalid_tape_ids = int(merged_df["loan_id"].isna().sum())
     if invalid_tape_ids:
         raise ValueError(
@@ -268,8 +283,8 @@ def merge_hoa_sources(
 
     selected_source_rank_by_column: dict[str, pd.Series] = {}
     for column in _HOA_VALUE_COLUMNS:
-        selected_values = pd.Series([None] * len(merged_df), dtype=object)
-        selected_rank = pd.Series([-1] * len(merged_df), dtype="int64")
+        selected_values = pd.Series(np.full(len(merged_df), None, dtype=object))
+        selected_rank = pd.Series(np.full(len(merged_df), -1, dtype="int64"))
 
         for rank, (prefix, _source) in enumerate(source_prefixes):
             source_values = work_df[f"{prefix}{column}"]
@@ -285,8 +300,8 @@ def merge_hoa_sources(
         merged_df[column] = selected_values
         selected_source_rank_by_column[column] = selected_rank
 
-    source_used = pd.Series([None] * len(merged_df), dtype=object)
-    source_file_used = pd.Series([None] * len(merged_df), dtype=object)
+    source_used = pd.Series(np.full(len(merged_df), None, dtype=object))
+    source_file_used = pd.Series(np.full(len(merged_df), None, dtype=object))
     for rank, (prefix, source) in enumerate(source_prefixes):
         contribution_mask = pd.Series(False, index=merged_df.index)
         for column in _HOA_VALUE_COLUMNS:
@@ -360,23 +375,14 @@ def merge_hoa_sources(
 
 def build_template_report_df(loan_master_df_enriched: pd.DataFrame) -> pd.DataFrame:
     """Map enriched loan master rows into the first 20 template report columns."""
+    index = loan_master_df_enriched.index
     column_lookup = _build_column_lookup(loan_master_df_enriched.columns)
-    mapped_series: dict[str, pd.Series] = {}
-    for output_column, aliases in _TEMPLATE_SOURCE_ALIASES.items():
-        mapped_series[output_column] = _select_first_matching_series(
-            loan_master_df_enriched,
-            column_lookup,
-            aliases,
-        )
-
-    report_df = pd.DataFrame(index=loan_master_df_enriched.index)
-    for output_column in TEMPLATE_REPORT_COLUMNS:
-        if output_column == "HOA":
-            report_df["HOA"] = _derive_hoa_flag(mapped_series["HOA Monthly Payment"])
-            continue
-        report_df[output_column] = mapped_series.get(
-            output_column,
-            pd.Series([None] * len(loan_master_df_enriched), index=loan_master_df_enriched.index, dtype=object),
-        )
-
-    return report_df.loc[:, TEMPLATE_REPORT_COLUMNS].copy()
+    columns: dict[str, Any] = {
+        output_column: _select_first_matching_values(loan_master_df_enriched, column_lookup, candidate_keys)
+        for output_column, candidate_keys in _TEMPLATE_FIELD_PLAN
+    }
+    hoa_monthly_payment = pd.Series(columns["HOA Monthly Payment"], index=index, copy=False)
+    columns["HOA"] = _derive_hoa_flag(hoa_monthly_payment).array
+
+    # One construction (and one copy per column) instead of growing the frame column by column.
+    return pd.DataFrame({column: columns[column] for column in TEMPLATE_REPORT_COLUMNS}, index=index)
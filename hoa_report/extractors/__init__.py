@@ -13,14 +13,16 @@ from hoa_report.extractors.registry import (
     list_vendor_extractors,
     register_vendor_extractor,
 )
-from hoa_report.extractors.semt import extract_semt_tape
+from hoa_report.extractors.semt import clear_tape_cache, extract_semt_tape, extract_semt_tape_cached
 
 __all__ = [
+    "clear_tape_cache",
     "extract_example_vendor",
     "extract_clayton_hoa",
     "extract_consolidated_analytics_hoa",
     "extract_dd_hoa",
     "extract_semt_tape",
+    "extract_semt_tape_cached",
     "extract_vendor_file",
     "get_vendor_extractor",
     "list_vendor_extractors",
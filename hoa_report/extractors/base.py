@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Protocol
 
 import pandas as pd
 
+# python-calamine (Rust) parses xlsx much faster than openpyxl; it stays optional.
+_EXCEL_ENGINE: str | None = "calamine" if find_spec("python_calamine") is not None else None
+
 
 class hoa_vendor_extractor(Protocol):
     """Protocol contract for vendor extractor implementations."""
@@ -16,3 +20,8 @@ class hoa_vendor_extractor(Protocol):
 
 
 VendorExtractorFn = Callable[[str | Path], pd.DataFrame]
+
+
+def read_excel_sheet(path: str | Path, sheet_name: str | int = 0) -> pd.DataFrame:
+    """Read one worksheet with cell values kept as Python objects."""
+    return pd.read_excel(path, sheet_name=sheet_name, dtype=object, engine=_EXCEL_ENGINE)
@@ -6,6 +6,7 @@ from typing import Any
 
 import pandas as pd
 
+from hoa_report.extractors.base import read_excel_sheet
 from hoa_report.qa import normalize_loan_id
 
 _SHEET_NAME = "HOA"
@@ -66,7 +67,7 @@ def _require_columns(raw_df: pd.DataFrame, *, path: Path) -> None:
 def extract_clayton_hoa(path: str | Path) -> pd.DataFrame:
     """Extract Clayton HOA rows into canonical Clayton columns."""
     path = Path(path)
-    raw_df = pd.read_excel(path, sheet_name=_SHEET_NAME, dtype=object)
+    raw_df = read_excel_sheet(path, sheet_name=_SHEET_NAME)
     _require_columns(raw_df, path=path)
 
     extracted = pd.DataFrame(
@@ -78,8 +79,9 @@ def extract_clayton_hoa(path: str | Path) -> pd.DataFrame:
     )
     extracted = extracted.loc[extracted["loan_id"].notna()].copy()
 
-    duplicate_ids = sorted(extracted.loc[extracted["loan_id"].duplicated(keep=False), "loan_id"].unique())
-    if duplicate_ids:
+    duplicate_mask = extracted["loan_id"].duplicated(keep=False)
+    if duplicate_mask.any():
+        duplicate_ids = sorted(extracted.loc[duplicate_mask, "loan_id"].unique())
         duplicate_summary = ", ".join(duplicate_ids)
         raise ValueError(
             "Clayton HOA extractor requires unique normalized loan_id values. "
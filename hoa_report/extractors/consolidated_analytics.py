@@ -6,6 +6,7 @@ from typing import Any
 
 import pandas as pd
 
+from hoa_report.extractors.base import read_excel_sheet
 from hoa_report.qa import normalize_loan_id
 
 _SHEET_NAME = "Redwood Additional Data"
@@ -66,7 +67,7 @@ def _require_columns(raw_df: pd.DataFrame, *, path: Path) -> None:
 def extract_consolidated_analytics_hoa(path: str | Path) -> pd.DataFrame:
     """Extract Consolidated Analytics HOA rows keyed by collateral_id."""
     path = Path(path)
-    raw_df = pd.read_excel(path, sheet_name=_SHEET_NAME, dtype=object)
+    raw_df = read_excel_sheet(path, sheet_name=_SHEET_NAME)
     _require_columns(raw_df, path=path)
 
     extracted = pd.DataFrame(
@@ -78,10 +79,9 @@ def extract_consolidated_analytics_hoa(path: str | Path) -> pd.DataFrame:
     )
     extracted = extracted.loc[extracted["collateral_id"].notna()].copy()
 
-    duplicate_ids = sorted(
-        extracted.loc[extracted["collateral_id"].duplicated(keep=False), "collateral_id"].unique()
-    )
-    if duplicate_ids:
+    duplicate_mask = extracted["collateral_id"].duplicated(keep=False)
+    if duplicate_mask.any():
+        duplicate_ids = sorted(extracted.loc[duplicate_mask, "collateral_id"].unique())
         duplicate_summary = ", ".join(duplicate_ids)
         raise ValueError(
             "Consolidated Analytics extractor requires unique normalized collateral_id values. "
@@ -7,6 +7,7 @@ from typing import Any
 
 import pandas as pd
 
+from hoa_report.extractors.base import read_excel_sheet
 from hoa_report.models import enforce_hoa_extractor_columns
 from hoa_report.qa import assert_unique_vendor_ids, normalize_loan_id
 
@@ -90,7 +91,7 @@ def _first_non_null(values: pd.Series) -> float | None:
 def extract_dd_hoa(path: str | Path) -> pd.DataFrame:
     """Extract DD HOA rows into canonical HOA output columns."""
     path = Path(path)
-    raw_df = pd.read_excel(path, sheet_name=0, dtype=object)
+    raw_df = read_excel_sheet(path, sheet_name=0)
 
     loan_id_column = _resolve_required_column(raw_df, required_key="loan_id", path=path)
     monthly_dues_column = _resolve_required_column(
@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from hoa_report.extractors.base import read_excel_sheet
+
 _SOURCE_LOAN_ID_COLUMN = "Loan Number"
 _OPTIONAL_COLUMN_MAP: tuple[tuple[str, str], ...] = (
     ("Monthly Dues", "hoa_monthly_dues_amount"),
@@ -17,7 +19,7 @@ _OPTIONAL_COLUMN_MAP: tuple[tuple[str, str], ...] = (
 def extract_example_vendor(path: str | Path) -> pd.DataFrame:
     """Example vendor extractor for synthetic fixtures and plug-in testing."""
     path = Path(path)
-    raw_df = pd.read_excel(path, sheet_name=0, dtype=object)
+    raw_df = read_excel_sheet(path, sheet_name=0)
 
     if _SOURCE_LOAN_ID_COLUMN not in raw_df.columns:
         raise ValueError(
@@ -10,7 +10,7 @@ from hoa_report.extractors.consolidated_analytics import extract_consolidated_an
 from hoa_report.extractors.dd_hoa import extract_dd_hoa
 from hoa_report.extractors.example_vendor import extract_example_vendor
 from hoa_report.models import HOA_WIDE_CANONICAL_COLUMNS
-from hoa_report.qa import assert_unique_vendor_ids, normalize_loan_id
+from hoa_report.qa import assert_unique_vendor_ids, normalize_loan_id_series
 
 _EXTRACTOR_REGISTRY: dict[str, VendorExtractorFn] = {
     "clayton": extract_clayton_hoa,
@@ -68,7 +68,7 @@ def _enforce_vendor_output_contract(
         if column not in canonical_df.columns:
             canonical_df[column] = None
 
-    canonical_df[id_column] = canonical_df[id_column].map(normalize_loan_id)
+    canonical_df[id_column] = normalize_loan_id_series(canonical_df[id_column])
 
     invalid_id_count = int(canonical_df[id_column].isna().sum())
     if invalid_id_count:
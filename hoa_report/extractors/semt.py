@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
 from pathlib import Path
 import re
+import threading
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from hoa_report.extractors.base import read_excel_sheet
 from hoa_report.models import build_hoa_extractor_df
 from hoa_report.qa import normalize_loan_id
 
@@ -39,6 +44,9 @@ _INTEREST_PAID_THROUGH_DATE_ALIASES: tuple[str, ...] = (
     "interest_paid_through_date",
     "interest_paid_thru_date",
 )
+_TAPE_CACHE_MAX_ENTRIES = 4
+_TAPE_CACHE: OrderedDict[tuple[str, int, int], tuple[pd.DataFrame, dict[str, Any]]] = OrderedDict()
+_TAPE_CACHE_LOCK = threading.Lock()
 
 
 def _is_blank(value: Any) -> bool:
@@ -71,12 +79,17 @@ def _resolve_optional_column(df: pd.DataFrame, aliases: tuple[str, ...]) -> obje
     return None
 
 
-def _clean_optional_text(value: object) -> object | None:
-    if _is_blank(value):
-        return None
-    if isinstance(value, str):
-        return value.strip()
-    return value
+def _clean_optional_values(values: pd.Series) -> pd.Series:
+    """Strip string cells and turn missing/whitespace-only cells into None, column at a time."""
+    values = values.astype(object)
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # No string cells at all, so only missing values need replacing.
+        return values.where(values.notna(), None)
+    # ``.str.strip`` yields NaN for non-string cells; keep those cells as read.
+    cleaned = stripped.where(stripped.notna(), values)
+    return cleaned.where(values.notna() & cleaned.ne(""), None)
 
 
 def _extract_optional_column_values(
@@ -86,8 +99,8 @@ def _extract_optional_column_values(
 ) -> tuple[pd.Series, str | None]:
     resolved_column = _resolve_optional_column(df, aliases)
     if resolved_column is None:
-        return pd.Series([None] * len(df), index=df.index, dtype=object), None
-    return df[resolved_column].map(_clean_optional_text), str(resolved_column)
+        return pd.Series(np.full(len(df), None, dtype=object), index=df.index), None
+    return _clean_optional_values(df[resolved_column]), str(resolved_column)
 
 
 def _derive_next_due_date(interest_paid_through_values: pd.Series) -> pd.Series:
@@ -121,7 +134,7 @@ def _resolve_loan_number_column(df: pd.DataFrame) -> tuple[object, str]:
 def extract_semt_tape(tape_path: str | Path) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Extract SEMT tape rows using authoritative loan population rules."""
     tape_path = Path(tape_path)
-    raw_df = pd.read_excel(tape_path, sheet_name=0, dtype=object)
+    raw_df = read_excel_sheet(tape_path, sheet_name=0)
 
     loan_number_column, resolution = _resolve_loan_number_column(raw_df)
     non_blank_loan_numbers = ~raw_df[loan_number_column].map(_is_blank)
@@ -174,3 +187,35 @@ def extract_semt_tape(tape_path: str | Path) -> tuple[pd.DataFrame, dict[str, An
         "interest_paid_through_date_column": interest_paid_through_date_column,
     }
     return canonical_hoa_df, tape_qa
+
+
+def extract_semt_tape_cached(tape_path: str | Path) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Memoized :func:`extract_semt_tape`, keyed on the file's resolved path, mtime and size."""
+    resolved_path = Path(tape_path).resolve()
+    stat = resolved_path.stat()
+    cache_key = (str(resolved_path), stat.st_mtime_ns, stat.st_size)
+    with _TAPE_CACHE_LOCK:
+        cached = _TAPE_CACHE.get(cache_key)
+        if cached is not None:
+            _TAPE_CACHE.move_to_end(cache_key)
+
+    if cached is None:
+        cached = extract_semt_tape(tape_path)
+        with _TAPE_CACHE_LOCK:
+            # A changed file supersedes any earlier snapshot of the same path.
+            for stale_key in [key for key in _TAPE_CACHE if key[0] == cache_key[0]]:
+                del _TAPE_CACHE[stale_key]
+            _TAPE_CACHE[cache_key] = cached
+            while len(_TAPE_CACHE) > _TAPE_CACHE_MAX_ENTRIES:
+                _TAPE_CACHE.popitem(last=False)
+
+    tape_df, tape_qa = cached
+    # Deep copies: without Copy-on-Write a shallow copy shares blocks, so cell writes would leak
+    # into the cached frame.
+    return tape_df.copy(), copy.deepcopy(tape_qa)
+
+
+def clear_tape_cache() -> None:
+    """Drop every tape held by :func:`extract_semt_tape_cached`."""
+    with _TAPE_CACHE_LOCK:
+        _TAPE_CACHE.clear()
@@ -16,15 +16,10 @@ _HOA_PAYMENT_NUMBER_FORMAT = "0.00"
 _VISIBLE_OUTPUT_SHEETS = frozenset({"Sheet1", "QA Summary"})
 
 
-def _to_excel_value(value: Any) -> Any:
-    if value is None:
-        return None
-    try:
-        if pd.isna(value):
-            return None
-    except (TypeError, ValueError):
-        return value
-    return value
+def _excel_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Object-dtype view of ``df`` with every missing value (NaN, NaT, NA) replaced by None."""
+    values = df.astype(object)
+    return values.where(df.notna(), None)
 
 
 def _is_blank(value: Any) -> bool:
@@ -70,20 +65,22 @@ def _resolve_style_source_row(
     return style_anchor_row
 
 
-def _copy_row_style(
+def _read_row_style(sheet: Worksheet, row_idx: int, col_count: int) -> tuple[list[Any], float | None]:
+    styles = [sheet.cell(row=row_idx, column=col_idx)._style for col_idx in range(1, col_count + 1)]
+    return styles, sheet.row_dimensions[row_idx].height
+
+
+def _apply_row_style(
     sheet: Worksheet,
-    source_row: int,
     target_row: int,
-    col_count: int,
+    row_style: tuple[list[Any], float | None],
 ) -> None:
-    for col_idx in range(1, col_count + 1):
-        source_cell = sheet.cell(row=source_row, column=col_idx)
-        target_cell = sheet.cell(row=target_row, column=col_idx)
-        target_cell._style = copy(source_cell._style)
+    styles, height = row_style
+    for col_idx, style in enumerate(styles, start=1):
+        sheet.cell(row=target_row, column=col_idx)._style = copy(style)
 
-    source_dim = sheet.row_dimensions[source_row]
-    if source_dim.height is not None:
-        sheet.row_dimensions[target_row].height = source_dim.height
+    if height is not None:
+        sheet.row_dimensions[target_row].height = height
 
 
 def _clear_existing_report_values(
@@ -105,30 +102,13 @@ def _is_numeric_hoa_payment(value: Any) -> bool:
     return not bool(pd.isna(value))
 
 
-def _write_dataframe(
-    sheet: Worksheet,
-    df: pd.DataFrame,
-    start_row: int = 1,
-    start_col: int = 1,
-    default_headers: list[str] | None = None,
-) -> None:
-    row_idx = start_row
-    columns = list(df.columns)
-    if not columns and default_headers:
-        columns = list(default_headers)
-
-    if columns:
-        for col_offset, header in enumerate(columns):
-            sheet.cell(row=row_idx, column=start_col + col_offset, value=header)
-        row_idx += 1
-
-    if df.empty:
-        return
+def _write_dataframe(sheet: Worksheet, df: pd.DataFrame) -> None:
+    """Append ``df`` (header row first) to a freshly created, empty worksheet."""
+    if len(df.columns):
+        sheet.append(list(df.columns))
 
-    for row_values in df.itertuples(index=False, name=None):
-        for col_offset, value in enumerate(row_values):
-            sheet.cell(row=row_idx, column=start_col + col_offset, value=_to_excel_value(value))
-        row_idx += 1
+    for row_values in _excel_values(df).itertuples(index=False, name=None):
+        sheet.append(row_values)
 
 
 def _replace_sheet(workbook: Workbook, title: str) -> Worksheet:
@@ -146,40 +126,30 @@ def _set_sheet_visibility(workbook: Workbook, visible_titles: set[str] | frozens
         sheet.sheet_state = "visible" if title in visible_titles else "hidden"
 
 
+def _clean_exception_ids(raw_loan_ids: Any) -> list[str]:
+    if not isinstance(raw_loan_ids, list | tuple | set):
+        return []
+    return [str(loan_id).strip() for loan_id in raw_loan_ids if not _is_blank(loan_id)]
+
+
 def _build_exception_rows(
     exceptions: Mapping[str, Mapping[str, Any]],
     key: str,
 ) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for vendor, values in exceptions.items():
-        raw_loan_ids = values.get(key)
-        if isinstance(raw_loan_ids, str) or raw_loan_ids is None:
-            continue
-        if not isinstance(raw_loan_ids, list | tuple | set):
-            continue
-        for loan_id in raw_loan_ids:
-            if _is_blank(loan_id):
-                continue
-            rows.append({"Vendor": vendor, "Loan ID": str(loan_id).strip()})
-    return pd.DataFrame(rows, columns=["Vendor", "Loan ID"])
+    rows = [
+        (vendor, loan_id)
+        for vendor, values in exceptions.items()
+        for loan_id in _clean_exception_ids(values.get(key))
+    ]
+    return pd.DataFrame.from_records(rows, columns=["Vendor", "Loan ID"])
 
 
 def _build_vendor_exception_rows(
     exception_values: Mapping[str, Any],
     key: str,
 ) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    raw_loan_ids = exception_values.get(key)
-    if isinstance(raw_loan_ids, str) or raw_loan_ids is None:
-        return pd.DataFrame(rows, columns=["Loan ID"])
-    if not isinstance(raw_loan_ids, list | tuple | set):
-        return pd.DataFrame(rows, columns=["Loan ID"])
-
-    for loan_id in raw_loan_ids:
-        if _is_blank(loan_id):
-            continue
-        rows.append({"Loan ID": str(loan_id).strip()})
-    return pd.DataFrame(rows, columns=["Loan ID"])
+    loan_ids = _clean_exception_ids(exception_values.get(key))
+    return pd.DataFrame({"Loan ID": pd.Series(loan_ids, dtype=object)})
 
 
 def _resolve_vendor_sheet_title(prefix: str, vendor: str, existing_titles: set[str]) -> str:
@@ -242,7 +212,16 @@ def write_report_from_template(
             col_count=report_col_count,
         )
 
-        for row_offset, row_values in enumerate(report_df.itertuples(index=False, name=None)):
+        # Missing values and the HOA payment number format are resolved once per frame/column
+        # instead of once per cell inside the row loop.
+        excel_df = _excel_values(report_df)
+        numeric_payment_rows = (
+            [_is_numeric_hoa_payment(value) for value in excel_df.iloc[:, hoa_payment_col_offset]]
+            if hoa_payment_col_offset is not None
+            else None
+        )
+        row_styles: dict[int, tuple[list[Any], float | None]] = {}
+        for row_offset, row_values in enumerate(excel_df.itertuples(index=False, name=None)):
             target_row = start_row + row_offset
             source_row = _resolve_style_source_row(
                 report_sheet,
@@ -253,26 +232,22 @@ def write_report_from_template(
                 style_anchor_row=style_anchor_row,
             )
             if source_row is not None and source_row != target_row:
-                _copy_row_style(
-                    report_sheet,
-                    source_row=source_row,
-                    target_row=target_row,
-                    col_count=report_col_count,
-                )
+                # Rows are never restyled after they have been used as a source, so the styles read
+                # the first time stay valid; most appended rows share the one anchor row.
+                row_style = row_styles.get(source_row)
+                if row_style is None:
+                    row_style = row_styles[source_row] = _read_row_style(
+                        report_sheet, source_row, report_col_count
+                    )
+                _apply_row_style(report_sheet, target_row, row_style)
 
             for col_offset, value in enumerate(row_values):
-                excel_value = _to_excel_value(value)
-                target_cell = report_sheet.cell(
+                report_sheet.cell(row=target_row, column=1 + col_offset, value=value)
+            if numeric_payment_rows is not None and numeric_payment_rows[row_offset]:
+                report_sheet.cell(
                     row=target_row,
-                    column=1 + col_offset,
-                    value=excel_value,
-                )
-                if (
-                    hoa_payment_col_offset is not None
-                    and col_offset == hoa_payment_col_offset
-                    and _is_numeric_hoa_payment(excel_value)
-                ):
-                    target_cell.number_format = _HOA_PAYMENT_NUMBER_FORMAT
+                    column=1 + hoa_payment_col_offset,
+                ).number_format = _HOA_PAYMENT_NUMBER_FORMAT
 
     qa_sheet = _replace_sheet(workbook, "QA Summary")
     _write_dataframe(qa_sheet, qa_df if qa_df is not None else pd.DataFrame())
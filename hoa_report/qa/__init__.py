@@ -1,15 +1,19 @@
 """Quality-assurance metrics and exception handling utilities."""
 
 from hoa_report.qa.loan_id import (
+    LOAN_ID_KEY_DTYPE,
     assert_unique_vendor_ids,
     find_duplicate_ids,
     normalize_loan_id,
+    normalize_loan_id_series,
 )
 from hoa_report.qa.metrics import compute_qa
 
 __all__ = [
+    "LOAN_ID_KEY_DTYPE",
     "assert_unique_vendor_ids",
     "compute_qa",
     "find_duplicate_ids",
     "normalize_loan_id",
+    "normalize_loan_id_series",
 ]
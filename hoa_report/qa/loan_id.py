@@ -2,23 +2,33 @@ from __future__ import annotations
 
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Any
 
+import pandas as pd
+
 _NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+_TRAILING_DOT_ZERO = r"\.0$"
+# Below this many records the per-value (cached) scalar path is cheaper than building a Series.
+_VECTORIZE_MIN_ROWS = 64
 
 
-def normalize_loan_id(x: Any) -> str | None:
-    """Normalize loan identifiers into a canonical deterministic format."""
-    if x is None:
-        return None
+def _loan_id_key_dtype() -> pd.StringDtype:
+    # Arrow-backed strings keep IDs in one contiguous buffer, so the vectorized string kernels and
+    # join hashing avoid per-value Python objects; pyarrow stays an optional dependency.
+    try:
+        return pd.StringDtype("pyarrow")
+    except ImportError:
+        return pd.StringDtype()
 
-    # NaN check without importing pandas/numpy.
-    if isinstance(x, float) and x != x:
-        return None
 
+LOAN_ID_KEY_DTYPE = _loan_id_key_dtype()
+
+
+def _normalize_loan_id_text(x: Any) -> str | None:
     normalized = str(x)
     normalized = normalized.strip()
-    normalized = re.sub(r"\.0$", "", normalized)
+    normalized = re.sub(_TRAILING_DOT_ZERO, "", normalized)
     normalized = _NON_ALNUM.sub("", normalized)
     normalized = normalized.upper()
 
@@ -27,11 +37,46 @@ def normalize_loan_id(x: Any) -> str | None:
     return normalized
 
 
+# Loan IDs repeat heavily across tape and vendor frames; ``typed`` keeps 1, 1.0 and True apart.
+_normalize_loan_id_text_cached = lru_cache(maxsize=65_536, typed=True)(_normalize_loan_id_text)
+
+
+def normalize_loan_id(x: Any) -> str | None:
+    """Normalize loan identifiers into a canonical deterministic format."""
+    # Covers None, NaN, pd.NA and NaT, matching normalize_loan_id_series.
+    if pd.api.types.is_scalar(x) and pd.isna(x):
+        return None
+
+    try:
+        return _normalize_loan_id_text_cached(x)
+    except TypeError:
+        # Unhashable values cannot be cache keys.
+        return _normalize_loan_id_text(x)
+
+
+def normalize_loan_id_series(values: pd.Series) -> pd.Series:
+    """Vectorized :func:`normalize_loan_id` that keeps the index and returns object dtype with None."""
+    missing = values.isna()
+    text = values.astype(object).where(~missing, "").astype(str).astype(LOAN_ID_KEY_DTYPE)
+    normalized = (
+        text.str.strip()
+        .str.replace(_TRAILING_DOT_ZERO, "", regex=True)
+        .str.replace(_NON_ALNUM.pattern, "", regex=True)
+        .str.upper()
+    )
+    keep = ~missing & normalized.ne("")
+    return normalized.astype(object).where(keep.to_numpy(dtype=bool), None)
+
+
 def _find_duplicate_ids_records(records: list[dict[str, Any]], id_col: str) -> list[dict[str, Any]]:
     if any(id_col not in record for record in records):
         raise KeyError(f"Column '{id_col}' not found in record(s)")
 
-    normalized_ids = [normalize_loan_id(record[id_col]) for record in records]
+    if len(records) > _VECTORIZE_MIN_ROWS:
+        values = pd.Series([record[id_col] for record in records], dtype=object)
+        normalized_ids = normalize_loan_id_series(values).tolist()
+    else:
+        normalized_ids = [normalize_loan_id(record[id_col]) for record in records]
     counts = Counter(value for value in normalized_ids if value is not None)
 
     duplicates: list[dict[str, Any]] = []
@@ -51,7 +96,7 @@ def find_duplicate_ids(df: Any, id_col: str) -> Any:
     if not hasattr(df, "columns") or id_col not in df.columns:
         raise KeyError(f"Column '{id_col}' not found in DataFrame")
 
-    normalized_ids = df[id_col].map(normalize_loan_id)
+    normalized_ids = normalize_loan_id_series(df[id_col])
     mask = normalized_ids.notna() & normalized_ids.duplicated(keep=False)
 
     duplicates = df.loc[mask].copy()
@@ -5,7 +5,7 @@ from typing import Any
 
 import pandas as pd
 
-from hoa_report.qa.loan_id import normalize_loan_id
+from hoa_report.qa.loan_id import normalize_loan_id_series
 
 
 def _is_blank(value: object) -> bool:
@@ -25,7 +25,7 @@ def _safe_frame_rows(df: pd.DataFrame | None) -> int:
 def _normalized_ids(df: pd.DataFrame | None, loan_id_column: str) -> pd.Series:
     if df is None or loan_id_column not in df.columns:
         return pd.Series(dtype=object)
-    return df[loan_id_column].map(normalize_loan_id)
+    return normalize_loan_id_series(df[loan_id_column])
 
 
 def _coerce_vendor_frames(
@@ -86,7 +86,7 @@ def compute_qa(
     if vendor_ids:
         matched = int(len(tape_id_set & vendor_ids))
     elif merged_df is not None and loan_id_column in merged_df.columns and hoa_value_column in merged_df.columns:
-        merged_ids = merged_df[loan_id_column].map(normalize_loan_id)
+        merged_ids = normalize_loan_id_series(merged_df[loan_id_column])
         has_hoa_value = ~merged_df[hoa_value_column].map(_is_blank)
         matched = int(merged_ids.loc[has_hoa_value].dropna().nunique())
     else:
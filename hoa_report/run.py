@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Sequence
 
+import numpy as np
 import pandas as pd
 
 from hoa_report.config import InputConfig, VendorInputConfig, load_config, validate_paths
 from hoa_report.engine import TEMPLATE_REPORT_COLUMNS, build_template_report_df
-from hoa_report.extractors import extract_semt_tape, extract_vendor_file, get_vendor_extractor
+from hoa_report.extractors import extract_semt_tape_cached, extract_vendor_file, get_vendor_extractor
 from hoa_report.io import write_report_from_template
-from hoa_report.qa import compute_qa, normalize_loan_id
+from hoa_report.qa import LOAN_ID_KEY_DTYPE, compute_qa, normalize_loan_id_series
 from hoa_report.sql import merge_sql_enrichment_onto_tape, run_sql_enrichment_query
 
 _QA_PRINT_ORDER: tuple[tuple[str, str], ...] = (
@@ -31,6 +33,7 @@ _REVIEW_STATUS_HEADER = "Review Status"
 _LIMITED_REVIEW_STATUS = "limited review"
 _LIMITED_REVIEW_HOA_FLAG = "TBD"
 _LIMITED_REVIEW_HOA_PAYMENT = "Limited Review - please refer to URAR"
+_MAX_BACKGROUND_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -131,14 +134,18 @@ def _print_qa_summary(qa_dict: dict[str, int | float]) -> None:
         print(f"- {label}: {_format_qa_value(metric_key, qa_dict.get(metric_key, ''))}")
 
 
-def _is_blank(value: object) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str):
-        return not value.strip()
-    if isinstance(value, float) and value != value:
-        return True
-    return False
+def _blank_mask(values: pd.Series) -> pd.Series:
+    """Flag missing values and whitespace-only strings without a Python call per row."""
+    mask = values.isna()
+    if values.dtype.kind in "iufcbmM":
+        # Numeric/bool/datetime columns cannot hold strings, so only missing values are blank.
+        return mask
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # Object column without any string values, so only missing values are blank.
+        return mask
+    return mask | stripped.eq("").fillna(False).astype(bool)
 
 
 def _resolve_vendor_order(
@@ -148,7 +155,8 @@ def _resolve_vendor_order(
     if not vendors:
         return []
 
-    by_name = {vendor.name.lower(): vendor for vendor in vendors}
+    names_lower = [vendor.name.strip().lower() for vendor in vendors]
+    by_name = dict(zip(names_lower, vendors))
     ordered: list[VendorInputConfig] = []
     seen: set[str] = set()
 
@@ -167,8 +175,7 @@ def _resolve_vendor_order(
         seen.add(key)
         ordered.append(vendor)
 
-    for vendor in vendors:
-        key = vendor.name.lower()
+    for key, vendor in zip(names_lower, vendors):
         if key in seen:
             continue
         seen.add(key)
@@ -188,17 +195,16 @@ def _build_collateral_to_loan_map(
 
     map_df = pd.DataFrame(
         {
-            "loan_id": loan_ids.map(normalize_loan_id),
-            "collateral_id": report_df["Collateral ID"].map(normalize_loan_id),
+            "loan_id": loan_ids,
+            "collateral_id": normalize_loan_id_series(report_df["Collateral ID"]),
         },
         dtype=object,
     )
     map_df = map_df.loc[map_df["loan_id"].notna() & map_df["collateral_id"].notna()].copy()
 
-    duplicate_collateral_ids = sorted(
-        map_df.loc[map_df["collateral_id"].duplicated(keep=False), "collateral_id"].unique().tolist()
-    )
-    if duplicate_collateral_ids:
+    duplicate_mask = map_df["collateral_id"].duplicated(keep=False)
+    if duplicate_mask.any():
+        duplicate_collateral_ids = sorted(map_df.loc[duplicate_mask, "collateral_id"].unique().tolist())
         duplicate_summary = ", ".join(duplicate_collateral_ids)
         raise ValueError(
             "Duplicate normalized collateral_id values found in tape->collateral mapping. "
@@ -208,6 +214,15 @@ def _build_collateral_to_loan_map(
     return map_df.loc[:, ["loan_id", "collateral_id"]].reset_index(drop=True)
 
 
+def _background_worker_count(task_count: int) -> int:
+    return max(1, min(_MAX_BACKGROUND_WORKERS, task_count))
+
+
+def _cancel_futures(futures: Sequence[Future[Any]]) -> None:
+    for future in futures:
+        future.cancel()
+
+
 def _extract_vendor_frame(vendor: VendorInputConfig) -> pd.DataFrame:
     id_column = "loan_id" if vendor.match_key == "loan_id" else "collateral_id"
     return extract_vendor_file(vendor.type, vendor.path, id_column=id_column)
@@ -217,17 +232,17 @@ def _map_vendor_rows_to_loan_id(
     *,
     vendor: VendorInputConfig,
     extracted_df: pd.DataFrame,
-    tape_loan_ids: set[str],
+    tape_loan_ids: pd.Index,
     collateral_to_loan_map_df: pd.DataFrame | None,
 ) -> _ProcessedVendor:
     if vendor.match_key == "loan_id":
         mapped_df = extracted_df.copy()
-        mapped_df["loan_id"] = mapped_df["loan_id"].map(normalize_loan_id)
+        mapped_df["loan_id"] = normalize_loan_id_series(mapped_df["loan_id"])
 
-        vendor_id_set = set(mapped_df["loan_id"].dropna().tolist())
-        matched_id_set = vendor_id_set & tape_loan_ids
-        missing_ids = sorted(tape_loan_ids - vendor_id_set)
-        extra_ids = sorted(vendor_id_set - tape_loan_ids)
+        vendor_ids = pd.Index(mapped_df["loan_id"].dropna().unique())
+        matched_ids = tape_loan_ids.intersection(vendor_ids)
+        missing_ids = sorted(tape_loan_ids.difference(vendor_ids).tolist())
+        extra_ids = sorted(vendor_ids.difference(tape_loan_ids).tolist())
 
         matched_df = mapped_df.loc[mapped_df["loan_id"].isin(tape_loan_ids)].copy()
     else:
@@ -242,18 +257,17 @@ def _map_vendor_rows_to_loan_id(
             how="left",
         )
 
-        vendor_id_set = set(extracted_df["collateral_id"].dropna().tolist())
+        vendor_ids = pd.Index(extracted_df["collateral_id"].dropna().unique())
         extra_ids = sorted(
             mapped_df.loc[mapped_df["loan_id"].isna(), "collateral_id"].dropna().unique().tolist()
         )
         matched_df = mapped_df.loc[mapped_df["loan_id"].notna()].copy()
-        matched_id_set = set(matched_df["loan_id"].dropna().tolist())
-        missing_ids = sorted(tape_loan_ids - matched_id_set)
+        matched_ids = pd.Index(matched_df["loan_id"].dropna().unique())
+        missing_ids = sorted(tape_loan_ids.difference(matched_ids).tolist())
 
-    duplicate_mapped_loans = sorted(
-        matched_df.loc[matched_df["loan_id"].duplicated(keep=False), "loan_id"].dropna().unique().tolist()
-    )
-    if duplicate_mapped_loans:
+    duplicate_mask = matched_df["loan_id"].notna() & matched_df["loan_id"].duplicated(keep=False)
+    if duplicate_mask.any():
+        duplicate_mapped_loans = sorted(matched_df.loc[duplicate_mask, "loan_id"].unique().tolist())
         duplicate_summary = ", ".join(duplicate_mapped_loans)
         raise ValueError(
             f"Vendor '{vendor.name}' produced duplicate mapped loan_id values after "
@@ -262,9 +276,9 @@ def _map_vendor_rows_to_loan_id(
 
     qa_summary: dict[str, int | float] = {
         "vendor_rows": int(len(extracted_df)),
-        "vendor_unique_ids": int(len(vendor_id_set)),
-        "matched_loans": int(len(matched_id_set)),
-        "match_rate": float(len(matched_id_set) / len(tape_loan_ids)) if tape_loan_ids else 0.0,
+        "vendor_unique_ids": int(len(vendor_ids)),
+        "matched_loans": int(len(matched_ids)),
+        "match_rate": float(len(matched_ids) / len(tape_loan_ids)) if len(tape_loan_ids) else 0.0,
         "missing_in_vendor": int(len(missing_ids)),
         "extra_in_vendor": int(len(extra_ids)),
     }
@@ -284,26 +298,22 @@ def _map_vendor_rows_to_loan_id(
     )
 
 
-def _derive_hoa_flags_from_amounts(amounts: pd.Series) -> pd.Series:
-    flags = pd.Series(["" for _ in range(len(amounts))], index=amounts.index, dtype=object)
-    flags.loc[amounts > 0] = "Y"
-    flags.loc[amounts == 0] = "N"
-    return flags
-
-
 def _should_default_blank_hoa_to_zero(vendor: VendorInputConfig) -> bool:
     return vendor.type.strip().lower() in {"dd_hoa", "consolidated_analytics"}
 
 
-def _is_limited_review(value: object) -> bool:
-    return isinstance(value, str) and value.strip().lower() == _LIMITED_REVIEW_STATUS
-
-
 def _apply_limited_review_overrides(report_df: pd.DataFrame) -> None:
     if _REVIEW_STATUS_HEADER not in report_df.columns:
         return
 
-    limited_review_mask = report_df[_REVIEW_STATUS_HEADER].map(_is_limited_review)
+    review_status = report_df[_REVIEW_STATUS_HEADER].astype("string")
+    limited_review_mask = (
+        review_status.str.strip()
+        .str.casefold()
+        .eq(_LIMITED_REVIEW_STATUS)
+        .fillna(False)
+        .astype(bool)
+    )
     if not bool(limited_review_mask.any()):
         return
 
@@ -336,7 +346,6 @@ def _fill_report_from_vendor(
         report_df["hoa_source_file_used"] = None
 
     work_df = matched_df.copy()
-    work_df["loan_id"] = work_df["loan_id"].map(normalize_loan_id)
     work_df["hoa_monthly_dues_amount"] = pd.to_numeric(
         work_df["hoa_monthly_dues_amount"],
         errors="coerce",
@@ -345,25 +354,39 @@ def _fill_report_from_vendor(
         # DD-matched rows with blank HOA should default to 0.0 in output.
         work_df["hoa_monthly_dues_amount"] = work_df["hoa_monthly_dues_amount"].fillna(0.0)
 
-    loan_indexed = work_df.set_index("loan_id", drop=False)
-    mapped_amount = tape_ids.map(loan_indexed["hoa_monthly_dues_amount"])
+    # One hash join of the tape keys against the vendor rows replaces a lookup per mapped column.
+    lookup = work_df.loc[
+        work_df["loan_id"].notna(),
+        ["loan_id", "hoa_monthly_dues_amount", "hoa_source", "hoa_source_file"],
+    ]
+    lookup = lookup.assign(loan_id=lookup["loan_id"].astype(LOAN_ID_KEY_DTYPE))
+    mapped = pd.DataFrame({"loan_id": tape_ids.astype(LOAN_ID_KEY_DTYPE).to_numpy()}).merge(
+        lookup,
+        on="loan_id",
+        how="left",
+        validate="m:1",
+    )
+    mapped.index = tape_ids.index
+    mapped_amount = mapped["hoa_monthly_dues_amount"]
 
-    payment_blank_mask = report_df[_HOA_VALUE_HEADER].map(_is_blank)
+    payment_blank_mask = _blank_mask(report_df[_HOA_VALUE_HEADER])
     fill_payment_mask = payment_blank_mask & mapped_amount.notna()
     report_df.loc[fill_payment_mask, _HOA_VALUE_HEADER] = mapped_amount.loc[fill_payment_mask]
 
-    derived_flag = _derive_hoa_flags_from_amounts(mapped_amount)
-    hoa_blank_mask = report_df[_HOA_FLAG_HEADER].map(_is_blank)
-    fill_hoa_mask = hoa_blank_mask & mapped_amount.notna()
-    report_df.loc[fill_hoa_mask, _HOA_FLAG_HEADER] = derived_flag.loc[fill_hoa_mask]
+    amount_values = mapped_amount.to_numpy(dtype="float64", na_value=np.nan)
+    # Negative amounts fall through to "" just like missing ones.
+    derived_flag = np.select([amount_values > 0, amount_values == 0], ["Y", "N"], default="").astype(object)
+    hoa_blank_mask = _blank_mask(report_df[_HOA_FLAG_HEADER]).to_numpy(dtype=bool)
+    fill_hoa_mask = hoa_blank_mask & ~np.isnan(amount_values)
+    report_df.loc[fill_hoa_mask, _HOA_FLAG_HEADER] = derived_flag[fill_hoa_mask]
 
     contribution_mask = fill_payment_mask | fill_hoa_mask
-    mapped_source = tape_ids.map(loan_indexed["hoa_source"])
-    mapped_file = tape_ids.map(loan_indexed["hoa_source_file"])
-    mapped_source.loc[mapped_source.map(_is_blank)] = processed_vendor.config.name
+    mapped_source = mapped["hoa_source"].copy()
+    mapped_file = mapped["hoa_source_file"]
+    mapped_source.loc[_blank_mask(mapped_source)] = processed_vendor.config.name
 
-    source_blank_mask = report_df["hoa_source_used"].map(_is_blank) & contribution_mask
-    source_file_blank_mask = report_df["hoa_source_file_used"].map(_is_blank) & contribution_mask
+    source_blank_mask = _blank_mask(report_df["hoa_source_used"]) & contribution_mask
+    source_file_blank_mask = _blank_mask(report_df["hoa_source_file_used"]) & contribution_mask
     report_df.loc[source_blank_mask, "hoa_source_used"] = mapped_source.loc[source_blank_mask]
     report_df.loc[source_file_blank_mask, "hoa_source_file_used"] = mapped_file.loc[source_file_blank_mask]
 
@@ -382,6 +405,7 @@ def _fill_report_from_clayton(
 ) -> pd.DataFrame:
     """Backward-compatible helper used by tests; delegates to blank-only fill semantics."""
     clayton_work_df = clayton_df.copy()
+    clayton_work_df["loan_id"] = normalize_loan_id_series(clayton_work_df["loan_id"])
     if "hoa_source" not in clayton_work_df.columns:
         clayton_work_df["hoa_source"] = "CLAYTON"
     if "hoa_source_file" not in clayton_work_df.columns:
@@ -397,7 +421,7 @@ def _fill_report_from_clayton(
     )
     _fill_report_from_vendor(
         report_df=report_df,
-        tape_ids=tape_ids.map(normalize_loan_id),
+        tape_ids=normalize_loan_id_series(tape_ids),
         processed_vendor=processed_vendor,
     )
     return report_df
@@ -452,99 +476,96 @@ def _values_disagree(values: Sequence[float]) -> bool:
     return len({value for value in values}) > 1
 
 
-def main(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+@dataclass(frozen=True)
+class ReportBuild:
+    report_df: pd.DataFrame
+    qa_df: pd.DataFrame
+    qa_dict: dict[str, int | float]
+    exceptions: dict[str, dict[str, object]]
 
-    config_path = Path(args.config)
-    if not config_path.exists():
-        parser.error(f"Config file not found: {config_path}")
 
-    try:
-        config = load_config(config_path)
-    except (OSError, ValueError) as exc:
-        parser.error(f"Failed to load config: {exc}")
+def build_report(config: InputConfig) -> ReportBuild:
+    """Extract, enrich and fill the report for ``config`` without writing any output.
 
-    effective_config = _build_effective_config(config, args)
-    try:
-        validate_paths(effective_config)
-    except FileNotFoundError as exc:
-        parser.error(str(exc))
+    Pipeline failures are raised as ``ValueError`` with a user-facing message.
+    """
+    ordered_vendors = _resolve_vendor_order(config.vendors, config.vendor_priority)
 
-    try:
-        for vendor in effective_config.vendors:
-            get_vendor_extractor(vendor.type)
-    except (KeyError, ValueError) as exc:
-        parser.error(str(exc))
+    if config.run_sql and config.sql is None:
+        raise ValueError("'sql' settings are required when 'run_sql' is true")
 
-    print("Input path validation: OK")
+    tape_df, tape_qa = extract_semt_tape_cached(config.tape_path)
 
-    tape_df, tape_qa = extract_semt_tape(effective_config.tape_path)
-    loan_master_df = tape_df
-    if effective_config.run_sql:
-        if effective_config.sql is None:
-            parser.error("'sql' settings are required when 'run_sql' is true")
-        try:
-            sql_enrichment_df = run_sql_enrichment_query(
+    processed_vendors: list[_ProcessedVendor] = []
+    loan_vendor_amounts: dict[str, list[float]] = {}
+    # SQL enrichment (network-bound) and vendor workbook reads (disk-bound) do not depend on each
+    # other, so they run concurrently and are joined where their results are first needed. Filling
+    # stays sequential so vendor priority order still wins.
+    worker_count = _background_worker_count(len(ordered_vendors) + int(config.run_sql))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        sql_future = None
+        if config.run_sql:
+            sql_future = executor.submit(
+                run_sql_enrichment_query,
                 tape_df=tape_df,
-                connection_string=effective_config.sql.connection_string,
-                query_path=effective_config.sql.query_path,
+                connection_string=config.sql.connection_string,
+                query_path=config.sql.query_path,
             )
-            loan_master_df = merge_sql_enrichment_onto_tape(tape_df, sql_enrichment_df)
-        except (FileNotFoundError, RuntimeError, ValueError) as exc:
-            parser.error(f"SQL enrichment failed: {exc}")
-
-    report_df = build_template_report_df(loan_master_df)
-    tape_ids = loan_master_df["loan_id"].map(normalize_loan_id)
-    invalid_tape_ids = int(tape_ids.isna().sum())
-    if invalid_tape_ids:
-        parser.error(f"Found {invalid_tape_ids} blank/unparseable tape loan_id values after enrichment")
-
-    tape_loan_id_set = set(tape_ids.dropna().tolist())
-
-    ordered_vendors: list[VendorInputConfig]
-    try:
-        ordered_vendors = _resolve_vendor_order(
-            effective_config.vendors,
-            effective_config.vendor_priority,
-        )
-    except ValueError as exc:
-        parser.error(str(exc))
-
-    requires_collateral_mapping = any(vendor.match_key == "collateral_id" for vendor in ordered_vendors)
-    collateral_to_loan_map_df: pd.DataFrame | None = None
-    if requires_collateral_mapping:
-        try:
-            collateral_to_loan_map_df = _build_collateral_to_loan_map(
-                loan_ids=tape_ids,
+        extraction_futures = [executor.submit(_extract_vendor_frame, vendor) for vendor in ordered_vendors]
+        pending_futures = [*extraction_futures, *([sql_future] if sql_future is not None else [])]
+
+        loan_master_df = tape_df
+        if sql_future is not None:
+            try:
+                sql_enrichment_df = sql_future.result()
+                loan_master_df = merge_sql_enrichment_onto_tape(tape_df, sql_enrichment_df)
+            except (FileNotFoundError, RuntimeError, ValueError) as exc:
+                _cancel_futures(pending_futures)
+                raise ValueError(f"SQL enrichment failed: {exc}") from exc
+
+        report_df = build_template_report_df(loan_master_df)
+        tape_ids = normalize_loan_id_series(loan_master_df["loan_id"])
+        invalid_tape_ids = int(tape_ids.isna().sum())
+        if invalid_tape_ids:
+            _cancel_futures(pending_futures)
+            raise ValueError(f"Found {invalid_tape_ids} blank/unparseable tape loan_id values after enrichment")
+
+        tape_loan_ids = pd.Index(tape_ids.dropna().unique())
+
+        requires_collateral_mapping = any(vendor.match_key == "collateral_id" for vendor in ordered_vendors)
+        collateral_to_loan_map_df: pd.DataFrame | None = None
+        if requires_collateral_mapping:
+            try:
+                collateral_to_loan_map_df = _build_collateral_to_loan_map(
+                    loan_ids=tape_ids,
+                    report_df=report_df,
+                )
+            except ValueError:
+                _cancel_futures(pending_futures)
+                raise
+
+        for vendor, extraction_future in zip(ordered_vendors, extraction_futures):
+            try:
+                extracted_df = extraction_future.result()
+                processed_vendor = _map_vendor_rows_to_loan_id(
+                    vendor=vendor,
+                    extracted_df=extracted_df,
+                    tape_loan_ids=tape_loan_ids,
+                    collateral_to_loan_map_df=collateral_to_loan_map_df,
+                )
+            except (TypeError, ValueError, KeyError) as exc:
+                _cancel_futures(pending_futures)
+                raise ValueError(f"Vendor '{vendor.name}' failed: {exc}") from exc
+
+            amount_map = _fill_report_from_vendor(
                 report_df=report_df,
+                tape_ids=tape_ids,
+                processed_vendor=processed_vendor,
             )
-        except ValueError as exc:
-            parser.error(str(exc))
+            for loan_id, amount in amount_map.items():
+                loan_vendor_amounts.setdefault(loan_id, []).append(amount)
 
-    processed_vendors: list[_ProcessedVendor] = []
-    loan_vendor_amounts: dict[str, list[float]] = {}
-    for vendor in ordered_vendors:
-        try:
-            extracted_df = _extract_vendor_frame(vendor)
-            processed_vendor = _map_vendor_rows_to_loan_id(
-                vendor=vendor,
-                extracted_df=extracted_df,
-                tape_loan_ids=tape_loan_id_set,
-                collateral_to_loan_map_df=collateral_to_loan_map_df,
-            )
-        except (TypeError, ValueError, KeyError) as exc:
-            parser.error(f"Vendor '{vendor.name}' failed: {exc}")
-
-        amount_map = _fill_report_from_vendor(
-            report_df=report_df,
-            tape_ids=tape_ids,
-            processed_vendor=processed_vendor,
-        )
-        for loan_id, amount in amount_map.items():
-            loan_vendor_amounts.setdefault(loan_id, []).append(amount)
-
-        processed_vendors.append(processed_vendor)
+            processed_vendors.append(processed_vendor)
 
     discrepant_loan_ids = {
         loan_id for loan_id, amounts in loan_vendor_amounts.items() if _values_disagree(amounts)
@@ -554,12 +575,13 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
     _apply_limited_review_overrides(report_df)
 
+    # Keep the report's native dtypes: limited-review rows hold text in the payment column and must
+    # still count as populated, so the amounts are not coerced to numeric here.
     qa_merged_df = pd.DataFrame(
         {
             "loan_id": tape_ids,
             "hoa_monthly_dues_amount": report_df[_HOA_VALUE_HEADER] if _HOA_VALUE_HEADER in report_df.columns else None,
-        },
-        dtype=object,
+        }
     )
     vendor_frames_for_qa = [processed_vendor.mapped_df for processed_vendor in processed_vendors]
     qa_df, qa_dict = compute_qa(
@@ -575,15 +597,53 @@ def main(argv: Sequence[str] | None = None) -> int:
         for processed_vendor in processed_vendors
     }
 
-    output_report_df = report_df.loc[:, TEMPLATE_REPORT_COLUMNS].copy()
+    return ReportBuild(
+        report_df=report_df.loc[:, TEMPLATE_REPORT_COLUMNS],
+        qa_df=qa_df,
+        qa_dict=qa_dict,
+        exceptions=vendor_exceptions,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    config_path = Path(args.config)
+    if not config_path.exists():
+        parser.error(f"Config file not found: {config_path}")
+
+    try:
+        config = load_config(config_path)
+    except (OSError, ValueError) as exc:
+        parser.error(f"Failed to load config: {exc}")
+
+    effective_config = _build_effective_config(config, args)
+    try:
+        validate_paths(effective_config)
+    except FileNotFoundError as exc:
+        parser.error(str(exc))
+
+    try:
+        for vendor in effective_config.vendors:
+            get_vendor_extractor(vendor.type)
+    except (KeyError, ValueError) as exc:
+        parser.error(str(exc))
+
+    print("Input path validation: OK")
+
+    try:
+        report = build_report(effective_config)
+    except ValueError as exc:
+        parser.error(str(exc))
 
     try:
         output_path = write_report_from_template(
             template_path=effective_config.template_path,
             output_path=effective_config.output_path,
-            report_df=output_report_df,
-            qa_df=qa_df,
-            exceptions=vendor_exceptions,
+            report_df=report.report_df,
+            qa_df=report.qa_df,
+            exceptions=report.exceptions,
         )
     except PermissionError:
         parser.error(
@@ -595,7 +655,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         parser.error(f"Failed to write output workbook at '{effective_config.output_path}': {exc}")
 
     print(f"Output written to: {output_path}")
-    _print_qa_summary(qa_dict)
+    _print_qa_summary(report.qa_dict)
     return 0
 
 
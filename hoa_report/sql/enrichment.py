@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qsl, unquote_plus, urlparse
 
 import pandas as pd
 
 from hoa_report.sql.load_ids import load_ids_to_temp_table
 
+_FETCH_BATCH_SIZE = 50_000
 
+
+@lru_cache(maxsize=32)
 def _build_pyodbc_connection_string(connection_string: str) -> str:
     parsed = urlparse(connection_string)
     if parsed.scheme.lower() != "mssql+pyodbc":
@@ -44,6 +49,38 @@ def _build_pyodbc_connection_string(connection_string: str) -> str:
     return ";".join(odbc_parts)
 
 
+@lru_cache(maxsize=8)
+def _get_engine(connection_string: str) -> Any:
+    # One engine per connection string for the life of the process, so repeated report runs reuse
+    # pooled, already-authenticated sessions. The temp table load drops any leftover #tape_loan_ids.
+    from sqlalchemy import create_engine
+
+    return create_engine(connection_string, pool_pre_ping=True)
+
+
+@lru_cache(maxsize=8)
+def _read_sql(query_path: Path, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size only key the cache, so an edited query file is read again.
+    query_sql = query_path.read_text(encoding="utf-8")
+    if not query_sql.strip():
+        raise ValueError(f"SQL enrichment query file is empty: {query_path}")
+    return query_sql
+
+
+def _fetch_frame(cursor: Any, columns: list[str]) -> pd.DataFrame:
+    # Each batch becomes a frame right away, so the driver's per-row tuples are released batch by
+    # batch instead of piling up for the whole result set.
+    frames: list[pd.DataFrame] = []
+    while True:
+        batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        if not batch:
+            break
+        frames.append(pd.DataFrame.from_records(batch, columns=columns))
+    if not frames:
+        return pd.DataFrame.from_records([], columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
 def _run_enrichment_sql_on_connection(
     tape_df: pd.DataFrame,
     *,
@@ -58,8 +95,7 @@ def _run_enrichment_sql_on_connection(
         while True:
             if cursor.description is not None:
                 columns = [col_desc[0] for col_desc in cursor.description]
-                rows = cursor.fetchall()
-                enrichment_df = pd.DataFrame.from_records(rows, columns=columns)
+                enrichment_df = _fetch_frame(cursor, columns)
                 break
             if not cursor.nextset():
                 raise ValueError(
@@ -79,15 +115,16 @@ def run_sql_enrichment_query(
     """
     Execute enrichment SQL using a pyodbc-backed SQLAlchemy engine.
 
-    The query is executed in the same DB session used to load #tape_loan_ids.
+    The query is executed in the same DB session used to load #tape_loan_ids. Engines are cached
+    per connection string, so sessions are pooled across calls.
     """
     query_file = Path(query_path)
     if not query_file.exists():
         raise FileNotFoundError(f"SQL enrichment query file not found: {query_file}")
 
-    query_sql = query_file.read_text(encoding="utf-8")
-    if not query_sql.strip():
-        raise ValueError(f"SQL enrichment query file is empty: {query_file}")
+    resolved_query_file = query_file.resolve()
+    stat = resolved_query_file.stat()
+    query_sql = _read_sql(resolved_query_file, stat.st_mtime_ns, stat.st_size)
 
     try:
         from sqlalchemy import create_engine
@@ -95,8 +132,7 @@ def run_sql_enrichment_query(
         create_engine = None
 
     if create_engine is not None:
-        engine = create_engine(connection_string)
-        raw_connection = engine.raw_connection()
+        raw_connection = _get_engine(connection_string).raw_connection()
         try:
             enrichment_df = _run_enrichment_sql_on_connection(
                 tape_df,
@@ -104,8 +140,8 @@ def run_sql_enrichment_query(
                 query_sql=query_sql,
             )
         finally:
+            # Returns the connection to the engine's pool rather than closing the session.
             raw_connection.close()
-            engine.dispose()
         return enrichment_df
 
     try:
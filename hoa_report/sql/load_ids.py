@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import re
+import string
 from collections.abc import Sequence
 from typing import Any, Protocol
 
+import numpy as np
 import pandas as pd
 
-from hoa_report.qa import normalize_loan_id
+from hoa_report.qa import normalize_loan_id_series
 
 LOAN_ID_COLUMN = "loan_id"
 DEFAULT_TEMP_TABLE = "#tape_loan_ids"
-_TEMP_TABLE_PATTERN = re.compile(r"^#[A-Za-z0-9_]+$")
+_TEMP_TABLE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_INSERT_BATCH_SIZE = 1000
 
 
 class CursorLike(Protocol):
@@ -26,7 +28,7 @@ def _require_column(df: pd.DataFrame, column: str, frame_name: str) -> None:
 
 def _normalize_required_ids(df: pd.DataFrame, *, loan_id_column: str, frame_name: str) -> pd.Series:
     _require_column(df, loan_id_column, frame_name)
-    normalized = df[loan_id_column].map(normalize_loan_id)
+    normalized = normalize_loan_id_series(df[loan_id_column])
     missing_count = int(normalized.isna().sum())
     if missing_count:
         raise ValueError(
@@ -37,12 +39,13 @@ def _normalize_required_ids(df: pd.DataFrame, *, loan_id_column: str, frame_name
 
 def _normalize_unique_ids(df: pd.DataFrame, *, loan_id_column: str, frame_name: str) -> list[str]:
     normalized = _normalize_required_ids(df, loan_id_column=loan_id_column, frame_name=frame_name)
-    deduped = dict.fromkeys(normalized.tolist())
-    return list(deduped)
+    return pd.unique(normalized.to_numpy()).tolist()
 
 
 def _validate_temp_table_name(temp_table: str) -> None:
-    if not _TEMP_TABLE_PATTERN.fullmatch(temp_table):
+    if not (
+        len(temp_table) > 1 and temp_table[0] == "#" and _TEMP_TABLE_NAME_CHARS.issuperset(temp_table[1:])
+    ):
         raise ValueError(
             f"Invalid SQL temp table name '{temp_table}'. Expected format '#name' with alphanumeric/underscore."
         )
@@ -67,10 +70,13 @@ def load_ids_to_temp_table(
 
     cursor.execute(f"IF OBJECT_ID('tempdb..{temp_table}') IS NOT NULL DROP TABLE {temp_table};")
     cursor.execute(f"CREATE TABLE {temp_table} ({loan_id_column} NVARCHAR(100) NOT NULL PRIMARY KEY);")
-    cursor.executemany(
-        f"INSERT INTO {temp_table} ({loan_id_column}) VALUES (?);",
-        [(loan_id,) for loan_id in loan_ids],
-    )
+    if hasattr(cursor, "fast_executemany"):
+        # pyodbc binds the INSERT parameters as one array instead of a round-trip per row.
+        cursor.fast_executemany = True
+    insert_sql = f"INSERT INTO {temp_table} ({loan_id_column}) VALUES (?);"
+    # Bounded batches keep each parameter array well inside SQL Server's TDS packet sweet spot.
+    for start in range(0, len(loan_ids), _INSERT_BATCH_SIZE):
+        cursor.executemany(insert_sql, list(zip(loan_ids[start : start + _INSERT_BATCH_SIZE])))
     return loan_ids
 
 
@@ -78,10 +84,14 @@ def validate_sql_enrichment_contract(
     enrichment_df: pd.DataFrame,
     *,
     loan_id_column: str = LOAN_ID_COLUMN,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """
     Validate SQL enrichment frame contract and return a normalized copy.
 
+    With ``copy=False`` the result shares column data with ``enrichment_df``; only the
+    loan_id column is replaced, and the input frame itself is never modified.
+
     Contract:
     - Must contain loan_id column.
     - loan_id values must be parseable.
@@ -101,9 +111,21 @@ def validate_sql_enrichment_contract(
             "enrichment_df has duplicate normalized loan_id values: " f"{duplicate_summary}"
         )
 
-    normalized_df = enrichment_df.copy()
+    normalized_df = enrichment_df.copy(deep=copy)
     normalized_df[loan_id_column] = normalized_ids
-    return normalized_df.reset_index(drop=True)
+    normalized_df.index = pd.RangeIndex(len(normalized_df))
+    return normalized_df
+
+
+def _enrichment_positions(tape_ids: pd.Index, enrichment_ids: pd.Index) -> np.ndarray:
+    """Row position in the enrichment frame for each tape ID, or -1 when it has no SQL row."""
+    if tape_ids.is_monotonic_increasing and enrichment_ids.is_monotonic_increasing:
+        # Both sides sorted (the usual ORDER BY loan_id result): a linear merge walk, no hash table.
+        _, _, positions = tape_ids.join(enrichment_ids, how="left", return_indexers=True)
+        if positions is None:
+            return np.arange(len(tape_ids), dtype=np.intp)
+        return positions
+    return enrichment_ids.get_indexer(tape_ids)
 
 
 def merge_sql_enrichment_onto_tape(
@@ -120,12 +142,14 @@ def merge_sql_enrichment_onto_tape(
         loan_id_column=loan_id_column,
         frame_name="tape_df",
     )
-    normalized_tape = tape_df.copy()
+    # Shallow copies: only the loan_id column is swapped out, the concat below copies the rest once.
+    normalized_tape = tape_df.copy(deep=False)
     normalized_tape[loan_id_column] = normalized_tape_ids
 
     normalized_enrichment = validate_sql_enrichment_contract(
         enrichment_df,
         loan_id_column=loan_id_column,
+        copy=False,
     )
 
     collisions = sorted(
@@ -138,5 +162,20 @@ def merge_sql_enrichment_onto_tape(
             f"{collision_summary}. Rename SQL columns before merging."
         )
 
-    merged = normalized_tape.merge(normalized_enrichment, on=loan_id_column, how="left")
+    if normalized_enrichment.empty:
+        # SQL returned no rows: every tape loan gets missing values for the enrichment columns.
+        enrichment_columns = normalized_enrichment.columns.drop(loan_id_column)
+        merged = normalized_tape.reindex(columns=[*normalized_tape.columns, *enrichment_columns])
+        return merged.reset_index(drop=True)
+
+    # Enrichment IDs are unique (validated above), so a left join is a positional lookup per tape
+    # row; -1 marks tape loans with no SQL row and reindexing fills those with NaN.
+    positions = _enrichment_positions(
+        pd.Index(normalized_tape[loan_id_column]),
+        pd.Index(normalized_enrichment[loan_id_column]),
+    )
+    enrichment_columns = normalized_enrichment.drop(columns=loan_id_column).reindex(positions)
+    enrichment_columns.index = normalized_tape.index
+
+    merged = pd.concat([normalized_tape, enrichment_columns], axis=1)
     return merged.reset_index(drop=True)
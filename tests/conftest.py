@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+XlsxFactory = Callable[..., Path]
+
+
+@pytest.fixture
+def xlsx_factory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> XlsxFactory:
+    """
+    Register in-memory "workbooks" that ``pd.read_excel`` serves without touching disk.
+
+    Registered paths are touched as empty files so existence checks pass; paths that were
+    not registered fall through to the real reader.
+    """
+    workbooks: dict[Path, dict[str, pd.DataFrame]] = {}
+    real_read_excel = pd.read_excel
+
+    def fake_read_excel(io: object, *args: object, **kwargs: object) -> pd.DataFrame:
+        sheets = workbooks.get(Path(io)) if isinstance(io, (str, Path)) else None
+        if sheets is None:
+            return real_read_excel(io, *args, **kwargs)
+
+        sheet_name = kwargs.get("sheet_name", args[0] if args else 0)
+        if isinstance(sheet_name, int):
+            sheet_name = list(sheets)[sheet_name]
+        if sheet_name not in sheets:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return sheets[sheet_name].copy()
+
+    monkeypatch.setattr(pd, "read_excel", fake_read_excel)
+
+    def make(df: pd.DataFrame, filename: str, sheet: str = "Sheet1") -> Path:
+        path = tmp_path / filename
+        # Mirror what an xlsx round trip returns: object cells, empty strings read back as missing.
+        frame = df.astype(object).reset_index(drop=True)
+        workbooks.setdefault(path, {})[sheet] = frame.mask(frame.isna() | frame.eq(""), np.nan)
+        path.touch()
+        return path
+
+    return make
@@ -5,20 +5,18 @@ from pathlib import Path
 
 import pytest
 
-from hoa_report.config import load_config
+from hoa_report.config import clear_config_cache, load_config
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
 
-
-def _write_config(filename: str, payload: dict[str, object]) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    config_path = _TEST_TMP_DIR / filename
-    config_path.write_text(json.dumps(payload), encoding="utf-8")
+def _write_config(tmp_path: Path, filename: str, payload: dict[str, object]) -> Path:
+    config_path = tmp_path / filename
+    config_path.write_bytes(json.dumps(payload).encode("utf-8"))
     return config_path
 
 
-def test_load_config_reads_legacy_vendor_settings_from_config() -> None:
+def test_load_config_reads_legacy_vendor_settings_from_config(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.vendor_type.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -36,8 +34,9 @@ def test_load_config_reads_legacy_vendor_settings_from_config() -> None:
     assert config.vendor_priority == ["example_vendor"]
 
 
-def test_load_config_defaults_legacy_vendor_type_when_missing() -> None:
+def test_load_config_defaults_legacy_vendor_type_when_missing(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.default_vendor_type.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -53,8 +52,9 @@ def test_load_config_defaults_legacy_vendor_type_when_missing() -> None:
     assert config.vendor_priority == ["example_vendor"]
 
 
-def test_load_config_reads_multi_vendor_settings_and_priority() -> None:
+def test_load_config_reads_multi_vendor_settings_and_priority(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.multi_vendor.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -85,8 +85,9 @@ def test_load_config_reads_multi_vendor_settings_and_priority() -> None:
     assert config.vendor_priority == ["clayton", "consolidated_analytics"]
 
 
-def test_load_config_requires_sql_connection_string_when_run_sql_true() -> None:
+def test_load_config_requires_sql_connection_string_when_run_sql_true(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.sql.required.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -100,8 +101,9 @@ def test_load_config_requires_sql_connection_string_when_run_sql_true() -> None:
         load_config(config_path)
 
 
-def test_load_config_reads_sql_connection_string_and_default_query_path() -> None:
+def test_load_config_reads_sql_connection_string_and_default_query_path(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.sql.default_query_path.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -122,8 +124,9 @@ def test_load_config_reads_sql_connection_string_and_default_query_path() -> Non
     assert config.sql.query_path == Path("sql/hoa_enrich.sql")
 
 
-def test_load_config_reads_sql_query_path_override() -> None:
+def test_load_config_reads_sql_query_path_override(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.sql.query_path_override.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -141,8 +144,9 @@ def test_load_config_reads_sql_query_path_override() -> None:
     assert config.sql.query_path == Path("sql/custom.sql")
 
 
-def test_load_config_resolves_output_path_template_with_deal_id() -> None:
+def test_load_config_resolves_output_path_template_with_deal_id(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.output_path.template.deal_id.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -158,8 +162,9 @@ def test_load_config_resolves_output_path_template_with_deal_id() -> None:
     assert config.output_path == Path("data/SEMT 2026-3 Servicer HOA.xlsx")
 
 
-def test_load_config_defaults_output_path_from_deal_id_when_unspecified() -> None:
+def test_load_config_defaults_output_path_from_deal_id_when_unspecified(tmp_path: Path) -> None:
     config_path = _write_config(
+        tmp_path,
         "config.output_path.default.deal_id.json",
         {
             "tape_path": "tests/fixtures/tape.synthetic.xlsx",
@@ -171,3 +176,37 @@ def test_load_config_defaults_output_path_from_deal_id_when_unspecified() -> Non
 
     config = load_config(config_path)
     assert config.output_path == Path("data/SEMT 2026-3 Servicer HOA.xlsx")
+
+
+def test_load_config_is_cached_until_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = {
+        "tape_path": "tests/fixtures/tape.synthetic.xlsx",
+        "template_path": "tests/fixtures/template.synthetic.xlsx",
+        "deal_id": "2026-1",
+    }
+    config_path = _write_config(tmp_path, "config.cached.json", payload)
+    parse_calls: list[str] = []
+    original_loads = json.loads
+
+    def _counting_loads(text: str, **kwargs: object) -> object:
+        parse_calls.append(text)
+        return original_loads(text, **kwargs)
+
+    monkeypatch.setattr("hoa_report.config.json.loads", _counting_loads)
+    clear_config_cache()
+
+    first = load_config(config_path)
+    first.deal_id = "MUTATED"
+    second = load_config(config_path)
+
+    assert len(parse_calls) == 1
+    assert second.deal_id == "2026-1"
+
+    _write_config(tmp_path, "config.cached.json", {**payload, "deal_id": "2026-22"})
+    third = load_config(config_path)
+
+    assert len(parse_calls) == 2
+    assert third.deal_id == "2026-22"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
@@ -7,26 +8,35 @@ import pytest
 
 from hoa_report.extractors import extract_clayton_hoa
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
+XlsxFactory = Callable[..., Path]
 
+_CLAYTON_DF = pd.DataFrame(
+    {
+        "Loan Number": [" 1001.0 ", "AB-22", "L-4", None, "  "],
+        "HOA Monthly Premium Amount": ["$125.00", "0", None, "$300.00", " $99.00 "],
+        "Ignored": ["x", "x", "x", "x", "x"],
+    }
+)
 
-def _write_clayton_fixture(filename: str, df: pd.DataFrame) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    fixture_path = _TEST_TMP_DIR / filename
-    with pd.ExcelWriter(fixture_path) as writer:
-        df.to_excel(writer, index=False, sheet_name="HOA")
-    return fixture_path
+_CLAYTON_MISSING_COLUMNS_DF = pd.DataFrame({"Loan Number": ["L-1"]})
 
+_CLAYTON_DUPLICATES_DF = pd.DataFrame(
+    {
+        "Loan Number": ["AB-22", "ab22"],
+        "HOA Monthly Premium Amount": ["100", "200"],
+    }
+)
 
-def test_extract_clayton_hoa_parses_amounts_and_enforces_output_columns() -> None:
-    raw_df = pd.DataFrame(
-        {
-            "Loan Number": [" 1001.0 ", "AB-22", "L-4", None, "  "],
-            "HOA Monthly Premium Amount": ["$125.00", "0", None, "$300.00", " $99.00 "],
-            "Ignored": ["x", "x", "x", "x", "x"],
-        }
-    )
-    fixture_path = _write_clayton_fixture("clayton.synthetic.xlsx", raw_df)
+
+def _write_clayton_fixture(xlsx_factory: XlsxFactory, filename: str, df: pd.DataFrame) -> Path:
+    return xlsx_factory(df, filename, sheet="HOA")
+
+
+def test_extract_clayton_hoa_parses_amounts_and_enforces_output_columns(
+    xlsx_factory: XlsxFactory,
+) -> None:
+    raw_df = _CLAYTON_DF
+    fixture_path = _write_clayton_fixture(xlsx_factory, "clayton.synthetic.xlsx", raw_df)
 
     extracted = extract_clayton_hoa(fixture_path)
 
@@ -47,22 +57,21 @@ def test_extract_clayton_hoa_parses_amounts_and_enforces_output_columns() -> Non
     assert extracted["hoa_source_file"].tolist() == [fixture_path.name, fixture_path.name, fixture_path.name]
 
 
-def test_extract_clayton_hoa_raises_when_required_columns_are_missing() -> None:
-    raw_df = pd.DataFrame({"Loan Number": ["L-1"]})
-    fixture_path = _write_clayton_fixture("clayton.missing_columns.synthetic.xlsx", raw_df)
-
-    with pytest.raises(ValueError, match="missing required column"):
-        extract_clayton_hoa(fixture_path)
-
-
-def test_extract_clayton_hoa_raises_when_normalized_loan_ids_are_duplicate() -> None:
-    raw_df = pd.DataFrame(
-        {
-            "Loan Number": ["AB-22", "ab22"],
-            "HOA Monthly Premium Amount": ["100", "200"],
-        }
-    )
-    fixture_path = _write_clayton_fixture("clayton.duplicates.synthetic.xlsx", raw_df)
-
-    with pytest.raises(ValueError, match="Duplicates found: AB22"):
+@pytest.mark.parametrize(
+    ("filename", "raw_df", "error"),
+    [
+        ("clayton.missing_columns.synthetic.xlsx", _CLAYTON_MISSING_COLUMNS_DF, "missing required column"),
+        ("clayton.duplicates.synthetic.xlsx", _CLAYTON_DUPLICATES_DF, "Duplicates found: AB22"),
+    ],
+    ids=["missing_columns", "duplicate_ids"],
+)
+def test_extract_clayton_hoa_raises_on_invalid_input(
+    xlsx_factory: XlsxFactory,
+    filename: str,
+    raw_df: pd.DataFrame,
+    error: str,
+) -> None:
+    fixture_path = _write_clayton_fixture(xlsx_factory, filename, raw_df)
+
+    with pytest.raises(ValueError, match=error):
         extract_clayton_hoa(fixture_path)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
@@ -7,26 +8,35 @@ import pytest
 
 from hoa_report.extractors import extract_consolidated_analytics_hoa
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
+XlsxFactory = Callable[..., Path]
 
+_CONSOLIDATED_DF = pd.DataFrame(
+    {
+        "Loan ID": [" COL-1 ", "abc.0", "L-3", None],
+        "Monthly HOA Payment Amount": ["$125.00", "0", None, "300"],
+        "Ignored": ["x", "x", "x", "x"],
+    }
+)
 
-def _write_fixture(filename: str, df: pd.DataFrame) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    fixture_path = _TEST_TMP_DIR / filename
-    with pd.ExcelWriter(fixture_path) as writer:
-        df.to_excel(writer, index=False, sheet_name="Redwood Additional Data")
-    return fixture_path
+_CONSOLIDATED_MISSING_COLUMNS_DF = pd.DataFrame({"Loan ID": ["COL-1"]})
 
+_CONSOLIDATED_DUPLICATES_DF = pd.DataFrame(
+    {
+        "Loan ID": ["AB-22", "ab22"],
+        "Monthly HOA Payment Amount": ["100", "200"],
+    }
+)
 
-def test_extract_consolidated_analytics_hoa_parses_amounts_and_columns() -> None:
-    raw_df = pd.DataFrame(
-        {
-            "Loan ID": [" COL-1 ", "abc.0", "L-3", None],
-            "Monthly HOA Payment Amount": ["$125.00", "0", None, "300"],
-            "Ignored": ["x", "x", "x", "x"],
-        }
-    )
-    fixture_path = _write_fixture("consolidated.synthetic.xlsx", raw_df)
+
+def _write_fixture(xlsx_factory: XlsxFactory, filename: str, df: pd.DataFrame) -> Path:
+    return xlsx_factory(df, filename, sheet="Redwood Additional Data")
+
+
+def test_extract_consolidated_analytics_hoa_parses_amounts_and_columns(
+    xlsx_factory: XlsxFactory,
+) -> None:
+    raw_df = _CONSOLIDATED_DF
+    fixture_path = _write_fixture(xlsx_factory, "consolidated.synthetic.xlsx", raw_df)
 
     extracted = extract_consolidated_analytics_hoa(fixture_path)
 
@@ -51,23 +61,21 @@ def test_extract_consolidated_analytics_hoa_parses_amounts_and_columns() -> None
     assert extracted["hoa_source_file"].tolist() == [fixture_path.name, fixture_path.name, fixture_path.name]
 
 
-def test_extract_consolidated_analytics_hoa_raises_when_columns_missing() -> None:
-    raw_df = pd.DataFrame({"Loan ID": ["COL-1"]})
-    fixture_path = _write_fixture("consolidated.missing_columns.synthetic.xlsx", raw_df)
-
-    with pytest.raises(ValueError, match="missing required column"):
+@pytest.mark.parametrize(
+    ("filename", "raw_df", "error"),
+    [
+        ("consolidated.missing_columns.synthetic.xlsx", _CONSOLIDATED_MISSING_COLUMNS_DF, "missing required column"),
+        ("consolidated.duplicates.synthetic.xlsx", _CONSOLIDATED_DUPLICATES_DF, "Duplicates found: AB22"),
+    ],
+    ids=["missing_columns", "duplicate_ids"],
+)
+def test_extract_consolidated_analytics_hoa_raises_on_invalid_input(
+    xlsx_factory: XlsxFactory,
+    filename: str,
+    raw_df: pd.DataFrame,
+    error: str,
+) -> None:
+    fixture_path = _write_fixture(xlsx_factory, filename, raw_df)
+
+    with pytest.raises(ValueError, match=error):
         extract_consolidated_analytics_hoa(fixture_path)
-
-
-def test_extract_consolidated_analytics_hoa_raises_on_duplicate_collateral_id() -> None:
-    raw_df = pd.DataFrame(
-        {
-            "Loan ID": ["AB-22", "ab22"],
-            "Monthly HOA Payment Amount": ["100", "200"],
-        }
-    )
-    fixture_path = _write_fixture("consolidated.duplicates.synthetic.xlsx", raw_df)
-
-    with pytest.raises(ValueError, match="Duplicates found: AB22"):
-        extract_consolidated_analytics_hoa(fixture_path)
-
@@ -1,54 +1,120 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import date
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from hoa_report.extractors import extract_semt_tape
+from hoa_report.extractors import clear_tape_cache, extract_semt_tape, extract_semt_tape_cached
+from hoa_report.extractors.semt import _clean_optional_values
 from hoa_report.models import HOA_EXTRACTOR_COLUMNS, HOA_WIDE_CANONICAL_COLUMNS
+from tests import _tiny_xlsx as tiny_xlsx
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
-
-
-def _write_synthetic_tape(filename: str, df: pd.DataFrame) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    tape_path = _TEST_TMP_DIR / filename
-    df.to_excel(tape_path, index=False)
-    return tape_path
-
-
-def test_extract_semt_tape_uses_exact_loan_number_header_first() -> None:
-    df = pd.DataFrame(
-        {
-            "A": ["first", "drop-blank", "third", "fourth", "drop-none"],
-            "B": [1, 2, 3, 4, 5],
-            "Loan Number": [" L-1001.0 ", "   ", "AB-22", "ab22", None],
-            "DD Firm": ["Firm A", "Drop Firm", "Firm B", "   ", "Drop Firm 2"],
-            "Review Status": ["Pass", "Drop", "Manual", None, "Drop 2"],
-            "Current Loan AMount": [101000, 999999, 202000, " ", 303000],
-            "Interest Paid Through Date": ["2026-01-15", "2026-02-01", "2026-01-31", " ", "2026-03-10"],
-            "D": ["x", "x", "x", "x", "x"],
-            "E": ["x", "x", "x", "x", "x"],
-            "F": ["x", "x", "x", "x", "x"],
-            "G": ["not", "a", "loan", "number", "column"],
-        }
-    )
-    tape_path = _write_synthetic_tape("semt_header.synthetic.xlsx", df)
+XlsxFactory = Callable[..., Path]
+
+_HEADER_DF = pd.DataFrame(
+    {
+        "A": ["first", "drop-blank", "third", "fourth", "drop-none"],
+        "B": [1, 2, 3, 4, 5],
+        "Loan Number": [" L-1001.0 ", "   ", "AB-22", "ab22", None],
+        "DD Firm": ["Firm A", "Drop Firm", "Firm B", "   ", "Drop Firm 2"],
+        "Review Status": ["Pass", "Drop", "Manual", None, "Drop 2"],
+        "Current Loan AMount": [101000, 999999, 202000, " ", 303000],
+        "Interest Paid Through Date": ["2026-01-15", "2026-02-01", "2026-01-31", " ", "2026-03-10"],
+        "D": ["x", "x", "x", "x", "x"],
+        "E": ["x", "x", "x", "x", "x"],
+        "F": ["x", "x", "x", "x", "x"],
+        "G": ["not", "a", "loan", "number", "column"],
+    }
+)
+
+_FALLBACK_DF = pd.DataFrame(
+    {
+        "A": ["row-1", "row-2", "row-3"],
+        "B": [10, 20, 30],
+        "C": ["x", "x", "x"],
+        "D": ["x", "x", "x"],
+        "E": ["x", "x", "x"],
+        "F": ["x", "x", "x"],
+        "G_value": ["LN-1", "   ", "LN-3"],
+        "H": ["tail", "tail", "tail"],
+    }
+)
+
+_ALIAS_DF = pd.DataFrame(
+    {
+        "Loan Number": ["L-1", "L-2"],
+        "DueDiligenceVendor": ["Firm X", "Firm Y"],
+        "SubLoanReviewType": ["Complete", "Pending"],
+        "CurrentLoanAmount": [150000, 250000],
+        "InterestPaidThroughDate": ["2026-03-30", "2026-04-30"],
+    }
+)
+
+_MISSING_G_DF = pd.DataFrame(
+    {
+        "A": [1],
+        "B": [2],
+        "C": [3],
+        "D": [4],
+        "E": [5],
+        "F": [6],
+    }
+)
+
+_BLANK_G_DF = pd.DataFrame(
+    {
+        "A": [1, 2],
+        "B": [1, 2],
+        "C": [1, 2],
+        "D": [1, 2],
+        "E": [1, 2],
+        "F": [1, 2],
+        "G_value": [" ", None],
+    }
+)
+
+
+def _write_synthetic_tape(xlsx_factory: XlsxFactory, filename: str, df: pd.DataFrame) -> Path:
+    return xlsx_factory(df, filename)
+
+
+def test_clean_optional_values_blanks_become_none_and_other_cells_keep_their_value() -> None:
+    values = pd.Series([101000, " ", None, float("nan"), " Firm A ", "", 2.5], index=range(3, 10))
+
+    cleaned = _clean_optional_values(values)
+
+    assert cleaned.dtype == object
+    assert cleaned.index.equals(values.index)
+    assert cleaned.tolist() == [101000, None, None, None, "Firm A", None, 2.5]
+    assert [type(value) for value in cleaned] == [int, *[type(None)] * 3, str, type(None), float]
+
+
+def test_clean_optional_values_without_strings_only_replaces_missing() -> None:
+    cleaned = _clean_optional_values(pd.Series([1.5, float("nan"), 3.0]))
+
+    assert cleaned.dtype == object
+    assert cleaned.tolist() == [1.5, None, 3.0]
+
+
+def test_extract_semt_tape_uses_exact_loan_number_header_first(xlsx_factory: XlsxFactory) -> None:
+    df = _HEADER_DF
+    tape_path = _write_synthetic_tape(xlsx_factory, "semt_header.synthetic.xlsx", df)
 
     loan_master_df, tape_qa = extract_semt_tape(tape_path)
 
-    assert loan_master_df.columns.tolist()[: len(HOA_EXTRACTOR_COLUMNS)] == list(HOA_EXTRACTOR_COLUMNS)
+    assert loan_master_df.columns[: len(HOA_EXTRACTOR_COLUMNS)].equals(pd.Index(HOA_EXTRACTOR_COLUMNS))
     assert {"dd_firm", "dd_review_type"}.issubset(loan_master_df.columns)
     assert loan_master_df["loan_id"].tolist() == ["L1001", "AB22", "AB22"]
     assert loan_master_df["hoa_source"].tolist() == ["semt_tape", "semt_tape", "semt_tape"]
     assert loan_master_df["hoa_source_file"].tolist() == [str(tape_path), str(tape_path), str(tape_path)]
     assert loan_master_df["dd_firm"].tolist() == ["Firm A", "Firm B", None]
     assert loan_master_df["dd_review_type"].tolist() == ["Pass", "Manual", None]
-    assert loan_master_df["current_loan_amount"].iloc[0] == 101000
-    assert loan_master_df["current_loan_amount"].iloc[1] == 202000
-    assert pd.isna(loan_master_df["current_loan_amount"].iloc[2])
+    assert loan_master_df["current_loan_amount"].tolist() == [101000, 202000, None]
+    assert [type(value) for value in loan_master_df["current_loan_amount"]] == [int, int, type(None)]
+    assert loan_master_df["current_loan_amount"].dtype == object
     assert loan_master_df["securitized_next_due_date"].tolist() == [date(2026, 2, 15), date(2026, 2, 28), None]
     for column in HOA_WIDE_CANONICAL_COLUMNS:
         if column in {"hoa_source", "hoa_source_file"}:
@@ -66,24 +132,13 @@ def test_extract_semt_tape_uses_exact_loan_number_header_first() -> None:
     assert tape_qa["interest_paid_through_date_column"] == "Interest Paid Through Date"
 
 
-def test_extract_semt_tape_falls_back_to_column_g() -> None:
-    df = pd.DataFrame(
-        {
-            "A": ["row-1", "row-2", "row-3"],
-            "B": [10, 20, 30],
-            "C": ["x", "x", "x"],
-            "D": ["x", "x", "x"],
-            "E": ["x", "x", "x"],
-            "F": ["x", "x", "x"],
-            "G_value": ["LN-1", "   ", "LN-3"],
-            "H": ["tail", "tail", "tail"],
-        }
-    )
-    tape_path = _write_synthetic_tape("semt_fallback.synthetic.xlsx", df)
+def test_extract_semt_tape_falls_back_to_column_g(xlsx_factory: XlsxFactory) -> None:
+    df = _FALLBACK_DF
+    tape_path = _write_synthetic_tape(xlsx_factory, "semt_fallback.synthetic.xlsx", df)
 
     loan_master_df, tape_qa = extract_semt_tape(tape_path)
 
-    assert loan_master_df.columns.tolist()[: len(HOA_EXTRACTOR_COLUMNS)] == list(HOA_EXTRACTOR_COLUMNS)
+    assert loan_master_df.columns[: len(HOA_EXTRACTOR_COLUMNS)].equals(pd.Index(HOA_EXTRACTOR_COLUMNS))
     assert {"dd_firm", "dd_review_type"}.issubset(loan_master_df.columns)
     assert loan_master_df["loan_id"].tolist() == ["LN1", "LN3"]
     assert loan_master_df["hoa_source"].tolist() == ["semt_tape", "semt_tape"]
@@ -106,17 +161,9 @@ def test_extract_semt_tape_falls_back_to_column_g() -> None:
     assert tape_qa["interest_paid_through_date_column"] is None
 
 
-def test_extract_semt_tape_maps_due_diligence_alias_headers() -> None:
-    df = pd.DataFrame(
-        {
-            "Loan Number": ["L-1", "L-2"],
-            "DueDiligenceVendor": ["Firm X", "Firm Y"],
-            "SubLoanReviewType": ["Complete", "Pending"],
-            "CurrentLoanAmount": [150000, 250000],
-            "InterestPaidThroughDate": ["2026-03-30", "2026-04-30"],
-        }
-    )
-    tape_path = _write_synthetic_tape("semt_dd_alias.synthetic.xlsx", df)
+def test_extract_semt_tape_maps_due_diligence_alias_headers(xlsx_factory: XlsxFactory) -> None:
+    df = _ALIAS_DF
+    tape_path = _write_synthetic_tape(xlsx_factory, "semt_dd_alias.synthetic.xlsx", df)
 
     loan_master_df, tape_qa = extract_semt_tape(tape_path)
 
@@ -131,36 +178,106 @@ def test_extract_semt_tape_maps_due_diligence_alias_headers() -> None:
     assert tape_qa["interest_paid_through_date_column"] == "InterestPaidThroughDate"
 
 
-def test_extract_semt_tape_fails_when_fallback_column_g_does_not_exist() -> None:
-    df = pd.DataFrame(
-        {
-            "A": [1],
-            "B": [2],
-            "C": [3],
-            "D": [4],
-            "E": [5],
-            "F": [6],
-        }
-    )
-    tape_path = _write_synthetic_tape("semt_missing_g.synthetic.xlsx", df)
+def test_extract_semt_tape_fails_when_fallback_column_g_does_not_exist(
+    xlsx_factory: XlsxFactory,
+) -> None:
+    df = _MISSING_G_DF
+    tape_path = _write_synthetic_tape(xlsx_factory, "semt_missing_g.synthetic.xlsx", df)
 
     with pytest.raises(ValueError, match=r"fewer than 7 columns"):
         extract_semt_tape(tape_path)
 
 
-def test_extract_semt_tape_fails_when_fallback_column_g_is_blank() -> None:
-    df = pd.DataFrame(
-        {
-            "A": [1, 2],
-            "B": [1, 2],
-            "C": [1, 2],
-            "D": [1, 2],
-            "E": [1, 2],
-            "F": [1, 2],
-            "G_value": [" ", None],
-        }
-    )
-    tape_path = _write_synthetic_tape("semt_blank_g.synthetic.xlsx", df)
+def test_extract_semt_tape_fails_when_fallback_column_g_is_blank(xlsx_factory: XlsxFactory) -> None:
+    df = _BLANK_G_DF
+    tape_path = _write_synthetic_tape(xlsx_factory, "semt_blank_g.synthetic.xlsx", df)
 
     with pytest.raises(ValueError, match=r"fallback column G is blank"):
         extract_semt_tape(tape_path)
+
+
+def _count_read_excel(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    read_calls: list[object] = []
+    original_read_excel = pd.read_excel
+
+    def _counting_read_excel(*args: object, **kwargs: object) -> pd.DataFrame:
+        read_calls.append(args[0])
+        return original_read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", _counting_read_excel)
+    return read_calls
+
+
+@pytest.fixture(autouse=True)
+def _empty_tape_cache() -> Iterator[None]:
+    clear_tape_cache()
+    yield
+    clear_tape_cache()
+
+
+def test_extract_semt_tape_cached_reuses_unchanged_tape(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A real file on disk: the cache keys on mtime and size, and the tape is rewritten below.
+    tape_path = tmp_path / "semt_cached.synthetic.xlsx"
+    tiny_xlsx.write(tape_path, ["Loan Number"], [("L-1",), ("L-2",)])
+    read_calls = _count_read_excel(monkeypatch)
+
+    first_df, first_qa = extract_semt_tape_cached(tape_path)
+    first_df["loan_id"] = None
+    first_qa["duplicate_loan_ids"].append("MUTATED")
+    second_df, second_qa = extract_semt_tape_cached(tape_path)
+
+    assert len(read_calls) == 1
+    assert second_df["loan_id"].tolist() == ["L1", "L2"]
+    assert second_qa["duplicate_loan_ids"] == []
+
+    tiny_xlsx.write(tape_path, ["Loan Number"], [("L-3",), ("L-4",), ("L-5",)])
+    third_df, _ = extract_semt_tape_cached(tape_path)
+
+    assert len(read_calls) == 2
+    assert third_df["loan_id"].tolist() == ["L3", "L4", "L5"]
+
+
+def test_extract_semt_tape_cached_cell_writes_do_not_reach_cache(tmp_path: Path) -> None:
+    tape_path = tmp_path / "semt_cell_write.synthetic.xlsx"
+    tiny_xlsx.write(tape_path, ["Loan Number"], [("L-1",), ("L-2",)])
+
+    first_df, _ = extract_semt_tape_cached(tape_path)
+    first_df.loc[0, "loan_id"] = "MUTATED"
+    first_df.iloc[1, first_df.columns.get_loc("loan_id")] = "MUTATED"
+    second_df, _ = extract_semt_tape_cached(tape_path)
+
+    assert second_df["loan_id"].tolist() == ["L1", "L2"]
+
+
+def test_extract_semt_tape_cached_evicts_least_recently_used_tapes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    read_calls = _count_read_excel(monkeypatch)
+    tape_paths = []
+    for index in range(10):
+        tape_path = tmp_path / f"semt_lru_{index}.synthetic.xlsx"
+        tiny_xlsx.write(tape_path, ["Loan Number"], [(f"L-{index}",)])
+        extract_semt_tape_cached(tape_path)
+        tape_paths.append(tape_path)
+
+    extract_semt_tape_cached(tape_paths[-1])
+    assert len(read_calls) == 10
+
+    oldest_df, _ = extract_semt_tape_cached(tape_paths[0])
+    assert len(read_calls) == 11
+    assert oldest_df["loan_id"].tolist() == ["L0"]
+
+
+def test_clear_tape_cache_forces_a_fresh_read(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tape_path = tmp_path / "semt_clear.synthetic.xlsx"
+    tiny_xlsx.write(tape_path, ["Loan Number"], [("L-1",)])
+    extract_semt_tape_cached(tape_path)
+    read_calls = _count_read_excel(monkeypatch)
+
+    extract_semt_tape_cached(tape_path)
+    clear_tape_cache()
+    extract_semt_tape_cached(tape_path)
+
+    assert len(read_calls) == 1
@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
-from hoa_report.qa import assert_unique_vendor_ids, find_duplicate_ids, normalize_loan_id
+from hoa_report.qa import (
+    assert_unique_vendor_ids,
+    find_duplicate_ids,
+    normalize_loan_id,
+    normalize_loan_id_series,
+)
 
+_NORMALIZE_CASES = [
+    (12345.0, "12345"),
+    ("  ab-12.0  ", "AB12"),
+    ("a b_c", "ABC"),
+    ("***", None),
+    (None, None),
+    (float("nan"), None),
+    (pd.NA, None),
+    (pd.NaT, None),
+]
 
-@pytest.mark.parametrize(
-    ("raw", "expected"),
-    [
-        (12345.0, "12345"),
-        ("  ab-12.0  ", "AB12"),
-        ("a b_c", "ABC"),
-        ("***", None),
-        (None, None),
-        (float("nan"), None),
-    ],
-)
+
+@pytest.mark.parametrize(("raw", "expected"), _NORMALIZE_CASES)
 def test_normalize_loan_id(raw: object, expected: str | None) -> None:
     assert normalize_loan_id(raw) == expected
 
 
+def test_normalize_loan_id_series_matches_scalar_rules() -> None:
+    raw_values = [raw for raw, _ in _NORMALIZE_CASES] + [1, True, "12.00"]
+    values = pd.Series(raw_values, index=range(10, 10 + len(raw_values)), dtype=object)
+
+    normalized = normalize_loan_id_series(values)
+
+    assert normalized.dtype == object
+    assert normalized.index.equals(values.index)
+    assert normalized.tolist() == [normalize_loan_id(raw) for raw in raw_values]
+
+
+def test_normalize_loan_id_accepts_unhashable_values() -> None:
+    assert normalize_loan_id(["ab-1"]) == "AB1"
+
+
 def test_find_duplicate_ids_returns_duplicate_rows_with_normalized_value() -> None:
     rows = [
         {"loan_id": " abc-1.0 ", "source": "tape"},
@@ -35,6 +57,41 @@ def test_find_duplicate_ids_returns_duplicate_rows_with_normalized_value() -> No
     assert {row["normalized_loan_id"] for row in duplicates} == {"ABC1", "XYZ2"}
 
 
+def test_find_duplicate_ids_vectorized_records_path_matches_scalar_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = [{"loan_id": f" L-{index % 90}.0 ", "row": index} for index in range(100)]
+    rows += [{"loan_id": None, "row": 100}, {"loan_id": "***", "row": 101}]
+
+    vectorized = find_duplicate_ids(rows, "loan_id")
+    monkeypatch.setattr("hoa_report.qa.loan_id._VECTORIZE_MIN_ROWS", len(rows))
+    scalar = find_duplicate_ids(rows, "loan_id")
+
+    assert len(vectorized) == 20
+    assert vectorized == scalar
+
+
+def test_find_duplicate_ids_treats_missing_ids_alike_on_both_sides_of_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = [
+        {"loan_id": pd.NA, "row": 0},
+        {"loan_id": pd.NA, "row": 1},
+        {"loan_id": pd.NaT, "row": 2},
+        {"loan_id": pd.NaT, "row": 3},
+        {"loan_id": float("nan"), "row": 4},
+        {"loan_id": "ab-1", "row": 5},
+        {"loan_id": "AB1", "row": 6},
+    ]
+
+    scalar = find_duplicate_ids(rows, "loan_id")
+    monkeypatch.setattr("hoa_report.qa.loan_id._VECTORIZE_MIN_ROWS", 0)
+    vectorized = find_duplicate_ids(rows, "loan_id")
+
+    assert [row["row"] for row in scalar] == [5, 6]
+    assert vectorized == scalar
+
+
 def test_assert_unique_vendor_ids_raises_clear_exception() -> None:
     vendor_rows = [{"loan_id": " 1001.0"}, {"loan_id": "1001"}, {"loan_id": "AB-22"}]
 
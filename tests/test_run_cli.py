@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import io
 import json
+import os
+from collections.abc import Callable
 from pathlib import Path
 from uuid import uuid4
 
@@ -8,98 +11,210 @@ import pandas as pd
 import pytest
 from openpyxl import Workbook, load_workbook
 
+from hoa_report.config import InputConfig, SqlConfig, VendorInputConfig
 from hoa_report.engine import TEMPLATE_REPORT_COLUMNS
-from hoa_report.run import main
+from hoa_report.run import ReportBuild, build_report, main
+from tests import _tiny_xlsx as tiny_xlsx
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
+XlsxFactory = Callable[..., Path]
 
 
-def _write_config(filename: str, payload: dict[str, object]) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    config_path = _TEST_TMP_DIR / filename
-    config_path.write_text(json.dumps(payload), encoding="utf-8")
+def _write_config(tmp_path: Path, filename: str, payload: dict[str, object]) -> Path:
+    config_path = tmp_path / filename
+    raw = json.dumps(payload).encode("utf-8")
+    fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, raw)
+    finally:
+        os.close(fd)
     return config_path
 
 
-def _write_tape_fixture(filename: str) -> Path:
-    return _write_tape_fixture_with_ids(filename, ["L-1001", "L-1002", "L-1003"])
+_SQL_SETTINGS: dict[str, object] = {
+    "run_sql": True,
+    "sql": {
+        "connection_string": (
+            "mssql+pyodbc://@RTSQLGEN01/LOANDATA?"
+            "driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
+        ),
+        "query_path": "sql/hoa_enrich.sql",
+    },
+}
 
 
-def _write_tape_fixture_with_ids(filename: str, loan_numbers: list[str]) -> Path:
-    tape_path = _TEST_TMP_DIR / filename
-    df = pd.DataFrame({"Loan Number": loan_numbers})
-    df.to_excel(tape_path, index=False)
-    return tape_path
+def _make_config(
+    *,
+    tape: Path | str,
+    template: Path | str,
+    vendors: list[Path | str],
+    output: Path | str,
+    vendor_type: str = "example_vendor",
+    extra: dict[str, object] | None = None,
+) -> dict[str, object]:
+    config: dict[str, object] = {
+        "tape_path": str(tape),
+        "template_path": str(template),
+        "vendor_paths": [str(vendor) for vendor in vendors],
+        "vendor_type": vendor_type,
+        "output_path": str(output),
+    }
+    if extra:
+        config.update(extra)
+    return config
 
 
-def _write_vendor_fixture(filename: str, rows: list[dict[str, object]]) -> Path:
-    vendor_path = _TEST_TMP_DIR / filename
-    pd.DataFrame(rows).to_excel(vendor_path, index=False)
-    return vendor_path
+def _write_xlsx(
+    path: Path,
+    sheet_name: str,
+    headers: list[str],
+    rows: list[dict[str, object]],
+) -> Path:
+    values = ([row.get(header) for header in headers] for row in rows)
+    return tiny_xlsx.write(path, headers, values, sheet=sheet_name)
 
 
-def _write_clayton_vendor_fixture(filename: str, rows: list[dict[str, object]]) -> Path:
-    vendor_path = _TEST_TMP_DIR / filename
-    with pd.ExcelWriter(vendor_path) as writer:
-        pd.DataFrame(rows).to_excel(writer, index=False, sheet_name="HOA")
-    return vendor_path
+def _row_headers(rows: list[dict[str, object]]) -> list[str]:
+    return list(dict.fromkeys(key for row in rows for key in row))
 
 
-def _write_consolidated_vendor_fixture(filename: str, rows: list[dict[str, object]]) -> Path:
-    vendor_path = _TEST_TMP_DIR / filename
-    with pd.ExcelWriter(vendor_path) as writer:
-        pd.DataFrame(rows).to_excel(writer, index=False, sheet_name="Redwood Additional Data")
-    return vendor_path
+def _write_tape_fixture_with_ids(tmp_path: Path, filename: str, loan_numbers: list[str]) -> Path:
+    rows = [{"Loan Number": loan_number} for loan_number in loan_numbers]
+    return _write_xlsx(tmp_path / filename, "Sheet1", ["Loan Number"], rows)
 
 
-def _write_template_fixture(filename: str) -> Path:
-    template_path = _TEST_TMP_DIR / filename
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Sheet1"
-    for col_idx, header in enumerate(TEMPLATE_REPORT_COLUMNS, start=1):
-        sheet.cell(row=1, column=col_idx, value=header)
-    workbook.save(template_path)
-    return template_path
+def _write_vendor_fixture(tmp_path: Path, filename: str, rows: list[dict[str, object]]) -> Path:
+    return _write_xlsx(tmp_path / filename, "Sheet1", _row_headers(rows), rows)
 
 
-def test_cli_runs_end_to_end_with_path_overrides_and_prints_qa_summary(capsys: pytest.CaptureFixture[str]) -> None:
-    tape_path = _write_tape_fixture("run_cli.tape.synthetic.xlsx")
-    template_path = _write_template_fixture("run_cli.template.synthetic.xlsx")
-    vendor_a_path = _write_vendor_fixture(
-        "run_cli.vendor_a.synthetic.xlsx",
-        [
-            {"Loan Number": "L-1001", "Monthly Dues": 125.0},
-            {"Loan Number": "L-1002", "Monthly Dues": 225.0},
-        ],
-    )
-    vendor_b_path = _write_vendor_fixture(
-        "run_cli.vendor_b.synthetic.xlsx",
-        [
-            {"Loan Number": "L-1003", "Monthly Dues": 300.0},
-        ],
+def _write_clayton_vendor_fixture(tmp_path: Path, filename: str, rows: list[dict[str, object]]) -> Path:
+    return _write_xlsx(tmp_path / filename, "HOA", _row_headers(rows), rows)
+
+
+def _write_consolidated_vendor_fixture(tmp_path: Path, filename: str, rows: list[dict[str, object]]) -> Path:
+    return _write_xlsx(tmp_path / filename, "Redwood Additional Data", _row_headers(rows), rows)
+
+
+def _build_template_bytes() -> bytes:
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(list(TEMPLATE_REPORT_COLUMNS))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+_TEMPLATE_BYTES = _build_template_bytes()
+
+
+def _materialize(payload: bytes, path: Path) -> Path:
+    path.write_bytes(payload)
+    return path
+
+
+def _read_report(output_path: Path) -> tuple[list[tuple[object, ...]], list[str]]:
+    workbook = load_workbook(output_path, read_only=True, data_only=True)
+    try:
+        return list(workbook["Sheet1"].iter_rows(values_only=True)), workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def _build_report(
+    tape_path: Path,
+    vendors: list[VendorInputConfig],
+    *,
+    vendor_priority: list[str] | None = None,
+    run_sql: bool = False,
+) -> ReportBuild:
+    # build_report never opens the template, so these tests skip writing one.
+    return build_report(
+        InputConfig(
+            tape_path=tape_path,
+            template_path=tape_path.with_name("unused.template.xlsx"),
+            vendors=vendors,
+            vendor_priority=vendor_priority or [],
+            run_sql=run_sql,
+            sql=SqlConfig(connection_string="mssql+pyodbc://@test/LOANDATA") if run_sql else None,
+        )
     )
 
+
+def _report_rows(report: ReportBuild) -> list[tuple[object, ...]]:
+    values = report.report_df.astype(object)
+    return list(values.where(values.notna(), None).itertuples(index=False, name=None))
+
+
+# Zero-based positions into report row tuples.
+_COL = {name: index for index, name in enumerate(TEMPLATE_REPORT_COLUMNS)}
+_HOA_COL = _COL["HOA"]
+_HOA_PAYMENT_COL = _COL["HOA Monthly Payment"]
+
+_STANDARD_LOAN_NUMBERS = ["L-1001", "L-1002", "L-1003"]
+_STANDARD_TAPE_DF = pd.DataFrame({"Loan Number": _STANDARD_LOAN_NUMBERS})
+_VENDOR_A_ROWS: list[dict[str, object]] = [
+    {"Loan Number": "L-1001", "Monthly Dues": 125.0},
+    {"Loan Number": "L-1002", "Monthly Dues": 225.0},
+]
+_VENDOR_B_ROWS: list[dict[str, object]] = [{"Loan Number": "L-1003", "Monthly Dues": 300.0}]
+
+
+@pytest.fixture(scope="session")
+def shared_fixture_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("run_cli_shared")
+
+
+@pytest.fixture(scope="session")
+def standard_tape_path(shared_fixture_dir: Path) -> Path:
+    rows = [{"Loan Number": loan_number} for loan_number in _STANDARD_LOAN_NUMBERS]
+    return _write_xlsx(shared_fixture_dir / "tape.synthetic.xlsx", "Sheet1", ["Loan Number"], rows)
+
+
+@pytest.fixture(scope="session")
+def standard_template_path(shared_fixture_dir: Path) -> Path:
+    return _materialize(_TEMPLATE_BYTES, shared_fixture_dir / "template.synthetic.xlsx")
+
+
+@pytest.fixture(scope="session")
+def vendor_a_path(shared_fixture_dir: Path) -> Path:
+    path = shared_fixture_dir / "vendor_a.synthetic.xlsx"
+    return _write_xlsx(path, "Sheet1", _row_headers(_VENDOR_A_ROWS), _VENDOR_A_ROWS)
+
+
+@pytest.fixture(scope="session")
+def vendor_b_path(shared_fixture_dir: Path) -> Path:
+    path = shared_fixture_dir / "vendor_b.synthetic.xlsx"
+    return _write_xlsx(path, "Sheet1", _row_headers(_VENDOR_B_ROWS), _VENDOR_B_ROWS)
+
+
+def test_cli_runs_end_to_end_with_path_overrides_and_prints_qa_summary(
+    capsys: pytest.CaptureFixture[str],
+    standard_tape_path: Path,
+    standard_template_path: Path,
+    vendor_a_path: Path,
+    vendor_b_path: Path,
+    tmp_path: Path,
+) -> None:
+
     config_path = _write_config(
+        tmp_path,
         "run_cli.override.config.json",
-        {
-            "tape_path": "tests/fixtures/does-not-exist.xlsx",
-            "template_path": "tests/fixtures/does-not-exist-template.xlsx",
-            "vendor_paths": ["tests/fixtures/does-not-exist-vendor.xlsx"],
-            "vendor_type": "example_vendor",
-            "output_path": "data/_test_tmp/should-not-be-used.xlsx",
-        },
+        _make_config(
+            tape="tests/fixtures/does-not-exist.xlsx",
+            template="tests/fixtures/does-not-exist-template.xlsx",
+            vendors=["tests/fixtures/does-not-exist-vendor.xlsx"],
+            output=tmp_path / "should-not-be-used.xlsx",
+        ),
     )
-    output_path = _TEST_TMP_DIR / f"run_cli.override.output.{uuid4().hex}.xlsx"
+    output_path = tmp_path / "run_cli.override.output.xlsx"
 
     exit_code = main(
         [
             "--config",
             str(config_path),
             "--tape-path",
-            str(tape_path),
+            str(standard_tape_path),
             "--template-path",
-            str(template_path),
+            str(standard_template_path),
             "--vendor-path",
             str(vendor_a_path),
             "--vendor-path",
@@ -116,17 +231,24 @@ def test_cli_runs_end_to_end_with_path_overrides_and_prints_qa_summary(capsys: p
     assert "QA Summary" in captured.out
     assert "Match Rate" in captured.out
 
+    report_rows, sheet_names = _read_report(output_path)
+    assert len(report_rows) == len(_STANDARD_LOAN_NUMBERS) + 1
+    assert set(sheet_names) == {"Sheet1", "QA Summary"}
+
 
-def test_cli_errors_when_override_path_does_not_exist(capsys: pytest.CaptureFixture[str]) -> None:
+def test_cli_errors_when_override_path_does_not_exist(
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
     config_path = _write_config(
+        tmp_path,
         "run_cli.invalid_path.config.json",
-        {
-            "tape_path": "tests/fixtures/tape.synthetic.xlsx",
-            "template_path": "tests/fixtures/template.synthetic.xlsx",
-            "vendor_paths": ["tests/fixtures/vendor_a.synthetic.xlsx"],
-            "vendor_type": "example_vendor",
-            "output_path": "data/_test_tmp/run_cli.invalid.output.xlsx",
-        },
+        _make_config(
+            tape="tests/fixtures/tape.synthetic.xlsx",
+            template="tests/fixtures/template.synthetic.xlsx",
+            vendors=["tests/fixtures/vendor_a.synthetic.xlsx"],
+            output=tmp_path / "run_cli.invalid.output.xlsx",
+        ),
     )
 
     with pytest.raises(SystemExit) as exc_info:
@@ -144,31 +266,28 @@ def test_cli_errors_when_override_path_does_not_exist(capsys: pytest.CaptureFixt
     assert "do not exist" in captured.err
 
 
-def test_cli_resolves_deal_id_in_output_filename(capsys: pytest.CaptureFixture[str]) -> None:
-    tape_path = _write_tape_fixture("run_cli.deal_id.tape.synthetic.xlsx")
-    template_path = _write_template_fixture("run_cli.deal_id.template.synthetic.xlsx")
-    vendor_path = _write_vendor_fixture(
-        "run_cli.deal_id.vendor.synthetic.xlsx",
-        [
-            {"Loan Number": "L-1001", "Monthly Dues": 125.0},
-            {"Loan Number": "L-1002", "Monthly Dues": 225.0},
-        ],
-    )
+def test_cli_resolves_deal_id_in_output_filename(
+    capsys: pytest.CaptureFixture[str],
+    standard_tape_path: Path,
+    standard_template_path: Path,
+    vendor_a_path: Path,
+    tmp_path: Path,
+) -> None:
 
     deal_id = f"2026-3-{uuid4().hex[:8]}"
-    output_template_path = _TEST_TMP_DIR / "SEMT {deal_id} Servicer HOA.xlsx"
-    expected_output_path = _TEST_TMP_DIR / f"SEMT {deal_id} Servicer HOA.xlsx"
+    output_template_path = tmp_path / "SEMT {deal_id} Servicer HOA.xlsx"
+    expected_output_path = tmp_path / f"SEMT {deal_id} Servicer HOA.xlsx"
 
     config_path = _write_config(
+        tmp_path,
         "run_cli.deal_id.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "deal_id": deal_id,
-            "vendor_paths": [str(vendor_path)],
-            "vendor_type": "example_vendor",
-            "output_path": str(output_template_path),
-        },
+        _make_config(
+            tape=standard_tape_path,
+            template=standard_template_path,
+            vendors=[vendor_a_path],
+            output=output_template_path,
+            extra={"deal_id": deal_id},
+        ),
     )
 
     exit_code = main(["--config", str(config_path)])
@@ -182,35 +301,24 @@ def test_cli_resolves_deal_id_in_output_filename(capsys: pytest.CaptureFixture[s
 def test_cli_runs_sql_enrichment_with_connection_string(
     capsys: pytest.CaptureFixture[str],
     monkeypatch: pytest.MonkeyPatch,
+    standard_template_path: Path,
+    xlsx_factory: XlsxFactory,
+    tmp_path: Path,
 ) -> None:
-    tape_path = _write_tape_fixture("run_cli.sql.tape.synthetic.xlsx")
-    template_path = _write_template_fixture("run_cli.sql.template.synthetic.xlsx")
-    vendor_a_path = _write_vendor_fixture(
-        "run_cli.sql.vendor_a.synthetic.xlsx",
-        [
-            {"Loan Number": "L-1001", "Monthly Dues": 125.0},
-            {"Loan Number": "L-1002", "Monthly Dues": 225.0},
-        ],
-    )
-    output_path = _TEST_TMP_DIR / f"run_cli.sql.output.{uuid4().hex}.xlsx"
+    tape_path = xlsx_factory(_STANDARD_TAPE_DF, "run_cli.sql.tape.synthetic.xlsx")
+    vendor_a_path = xlsx_factory(pd.DataFrame(_VENDOR_A_ROWS), "run_cli.sql.vendor_a.synthetic.xlsx")
+    output_path = tmp_path / "run_cli.sql.output.xlsx"
 
     config_path = _write_config(
+        tmp_path,
         "run_cli.sql.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendor_paths": [str(vendor_a_path)],
-            "vendor_type": "example_vendor",
-            "output_path": str(output_path),
-            "run_sql": True,
-            "sql": {
-                "connection_string": (
-                    "mssql+pyodbc://@RTSQLGEN01/LOANDATA?"
-                    "driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
-                ),
-                "query_path": "sql/hoa_enrich.sql",
-            },
-        },
+        _make_config(
+            tape=tape_path,
+            template=standard_template_path,
+            vendors=[vendor_a_path],
+            output=output_path,
+            extra=_SQL_SETTINGS,
+        ),
     )
 
     calls: list[dict[str, object]] = []
@@ -246,24 +354,25 @@ def test_cli_runs_sql_enrichment_with_connection_string(
 def test_cli_errors_with_actionable_message_when_output_is_locked(
     capsys: pytest.CaptureFixture[str],
     monkeypatch: pytest.MonkeyPatch,
+    xlsx_factory: XlsxFactory,
+    tmp_path: Path,
 ) -> None:
-    tape_path = _write_tape_fixture("run_cli.locked_output.tape.synthetic.xlsx")
-    template_path = _write_template_fixture("run_cli.locked_output.template.synthetic.xlsx")
-    vendor_path = _write_vendor_fixture(
+    tape_path = xlsx_factory(_STANDARD_TAPE_DF, "run_cli.locked_output.tape.synthetic.xlsx")
+    vendor_path = xlsx_factory(
+        pd.DataFrame([{"Loan Number": "L-1001", "Monthly Dues": 125.0}]),
         "run_cli.locked_output.vendor.synthetic.xlsx",
-        [{"Loan Number": "L-1001", "Monthly Dues": 125.0}],
     )
-    output_path = _TEST_TMP_DIR / "run_cli.locked_output.xlsx"
+    # write_report_from_template is stubbed below, so the template only has to exist.
+    template_path = tmp_path / "run_cli.locked_output.template.synthetic.xlsx"
+    template_path.touch()
+    output_path = tmp_path / "run_cli.locked_output.xlsx"
 
     config_path = _write_config(
+        tmp_path,
         "run_cli.locked_output.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendor_paths": [str(vendor_path)],
-            "vendor_type": "example_vendor",
-            "output_path": str(output_path),
-        },
+        _make_config(
+            tape=tape_path, template=template_path, vendors=[vendor_path], output=output_path
+        ),
     )
 
     def _raise_permission_error(**kwargs: object) -> Path:
@@ -281,130 +390,83 @@ def test_cli_errors_with_actionable_message_when_output_is_locked(
     assert "--out" in captured.err
 
 
-def test_cli_clayton_fills_only_blank_hoa_fields_and_prints_qa_summary(
-    capsys: pytest.CaptureFixture[str],
-) -> None:
-    tape_path = _write_tape_fixture_with_ids(
-        "run_cli.clayton.tape.synthetic.xlsx",
+_VENDOR_SEMANTICS_CASES = [
+    # Clayton only fills blank report fields; unmatched and blank-source loans stay blank.
+    pytest.param(
+        "clayton",
+        _write_clayton_vendor_fixture,
         ["L-1001", "L-1002", "L-1003", "L-1004"],
-    )
-    template_path = _write_template_fixture("run_cli.clayton.template.synthetic.xlsx")
-    clayton_path = _write_clayton_vendor_fixture(
-        "run_cli.clayton.vendor.synthetic.xlsx",
         [
             {"Loan Number": "L-1001", "HOA Monthly Premium Amount": "$125.00"},
             {"Loan Number": "L-1002", "HOA Monthly Premium Amount": "0"},
             {"Loan Number": "L-1003", "HOA Monthly Premium Amount": None},
             {"Loan Number": "X-9999", "HOA Monthly Premium Amount": "300"},
         ],
-    )
-    output_path = _TEST_TMP_DIR / f"run_cli.clayton.output.{uuid4().hex}.xlsx"
-
-    config_path = _write_config(
-        "run_cli.clayton.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendor_paths": [str(clayton_path)],
-            "vendor_type": "clayton",
-            "output_path": str(output_path),
-        },
-    )
-
-    exit_code = main(["--config", str(config_path)])
-
-    captured = capsys.readouterr()
-    assert exit_code == 0
-    assert output_path.exists()
-    assert "QA Summary" in captured.out
-    assert "Match Rate" in captured.out
-
-    workbook = load_workbook(output_path)
-    report_sheet = workbook["Sheet1"]
-
-    hoa_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA") + 1
-    hoa_payment_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA Monthly Payment") + 1
-
-    assert report_sheet.cell(row=2, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=2, column=hoa_payment_col_idx).value == 125.0
-
-    assert report_sheet.cell(row=3, column=hoa_col_idx).value == "N"
-    assert report_sheet.cell(row=3, column=hoa_payment_col_idx).value == 0.0
-
-    assert report_sheet.cell(row=4, column=hoa_col_idx).value in ("", None)
-    assert report_sheet.cell(row=4, column=hoa_payment_col_idx).value is None
-
-    assert report_sheet.cell(row=5, column=hoa_col_idx).value in ("", None)
-    assert report_sheet.cell(row=5, column=hoa_payment_col_idx).value is None
-
-
-def test_cli_dd_hoa_defaults_blank_matched_values_to_zero(
-    capsys: pytest.CaptureFixture[str],
-) -> None:
-    tape_path = _write_tape_fixture_with_ids(
-        "run_cli.dd_default_zero.tape.synthetic.xlsx",
+        [("Y", 125.0), ("N", 0.0), (None, None), (None, None)],
+        id="clayton_fills_only_blank_hoa_fields",
+    ),
+    # Matched DD row has blank HOA dues in source, so output defaults to 0.0 / N.
+    pytest.param(
+        "dd_hoa",
+        _write_vendor_fixture,
         ["L-1001", "L-1002", "L-1003"],
-    )
-    template_path = _write_template_fixture("run_cli.dd_default_zero.template.synthetic.xlsx")
-    dd_path = _write_vendor_fixture(
-        "run_cli.dd_default_zero.vendor.synthetic.xlsx",
         [
             {"Loan Number": "L-1001", "Monthly HOA Dues ($)": "$125.00"},
             {"Loan Number": "L-1002", "Monthly HOA Dues ($)": None},
             {"Loan Number": "X-9999", "Monthly HOA Dues ($)": "$300.00"},
         ],
+        [("Y", 125.0), ("N", 0.0), (None, None)],
+        id="dd_hoa_defaults_blank_matched_values_to_zero",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("vendor_type", "write_vendor_fixture", "loan_numbers", "vendor_rows", "expected"),
+    _VENDOR_SEMANTICS_CASES,
+)
+def test_build_report_single_vendor_hoa_fill_semantics(
+    tmp_path: Path,
+    vendor_type: str,
+    write_vendor_fixture: Callable[[Path, str, list[dict[str, object]]], Path],
+    loan_numbers: list[str],
+    vendor_rows: list[dict[str, object]],
+    expected: list[tuple[str | None, float | None]],
+) -> None:
+    prefix = f"run_cli.{vendor_type}"
+    tape_path = _write_tape_fixture_with_ids(
+        tmp_path, f"{prefix}.tape.synthetic.xlsx", loan_numbers
     )
-    output_path = _TEST_TMP_DIR / f"run_cli.dd_default_zero.output.{uuid4().hex}.xlsx"
+    vendor_path = write_vendor_fixture(tmp_path, f"{prefix}.vendor.synthetic.xlsx", vendor_rows)
 
-    config_path = _write_config(
-        "run_cli.dd_default_zero.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendor_paths": [str(dd_path)],
-            "vendor_type": "dd_hoa",
-            "output_path": str(output_path),
-        },
+    report = _build_report(
+        tape_path,
+        [VendorInputConfig(name=vendor_type, type=vendor_type, path=vendor_path)],
     )
 
-    exit_code = main(["--config", str(config_path)])
-
-    captured = capsys.readouterr()
-    assert exit_code == 0
-    assert output_path.exists()
-    assert "QA Summary" in captured.out
-
-    workbook = load_workbook(output_path)
-    report_sheet = workbook["Sheet1"]
-
-    hoa_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA") + 1
-    hoa_payment_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA Monthly Payment") + 1
-
-    assert report_sheet.cell(row=2, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=2, column=hoa_payment_col_idx).value == 125.0
-
-    # Matched DD row has blank HOA dues in source, so output defaults to 0.0 / N.
-    assert report_sheet.cell(row=3, column=hoa_col_idx).value == "N"
-    assert report_sheet.cell(row=3, column=hoa_payment_col_idx).value == 0.0
-
-    assert report_sheet.cell(row=4, column=hoa_col_idx).value in ("", None)
-    assert report_sheet.cell(row=4, column=hoa_payment_col_idx).value is None
-
-
-def test_cli_limited_review_hardcodes_hoa_fields(
-    capsys: pytest.CaptureFixture[str],
-) -> None:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    tape_path = _TEST_TMP_DIR / "run_cli.limited_review.tape.synthetic.xlsx"
-    pd.DataFrame(
-        {
-            "Loan Number": ["L-1001", "L-1002", "L-1003"],
-            "Review Status": ["Pass", "Limited Review", "Limited Review"],
-        }
-    ).to_excel(tape_path, index=False)
-
-    template_path = _write_template_fixture("run_cli.limited_review.template.synthetic.xlsx")
+    assert report.qa_dict["tape_rows"] == len(loan_numbers)
+    report_rows = _report_rows(report)
+    for row_idx, (expected_flag, expected_payment) in enumerate(expected):
+        if expected_flag is None:
+            assert report_rows[row_idx][_HOA_COL] in ("", None)
+        else:
+            assert report_rows[row_idx][_HOA_COL] == expected_flag
+        assert report_rows[row_idx][_HOA_PAYMENT_COL] == expected_payment
+
+
+def test_build_report_limited_review_hardcodes_hoa_fields(tmp_path: Path) -> None:
+    tape_path = _write_xlsx(
+        tmp_path / "run_cli.limited_review.tape.synthetic.xlsx",
+        "Sheet1",
+        ["Loan Number", "Review Status"],
+        [
+            {"Loan Number": "L-1001", "Review Status": "Pass"},
+            {"Loan Number": "L-1002", "Review Status": "Limited Review"},
+            {"Loan Number": "L-1003", "Review Status": "Limited Review"},
+        ],
+    )
     dd_path = _write_vendor_fixture(
+        tmp_path,
         "run_cli.limited_review.vendor.synthetic.xlsx",
         [
             {"Loan Number": "L-1001", "Monthly HOA Dues ($)": "$125.00"},
@@ -412,59 +474,55 @@ def test_cli_limited_review_hardcodes_hoa_fields(
             {"Loan Number": "X-9999", "Monthly HOA Dues ($)": "$300.00"},
         ],
     )
-    output_path = _TEST_TMP_DIR / f"run_cli.limited_review.output.{uuid4().hex}.xlsx"
 
-    config_path = _write_config(
-        "run_cli.limited_review.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendor_paths": [str(dd_path)],
-            "vendor_type": "dd_hoa",
-            "output_path": str(output_path),
-        },
+    report = _build_report(
+        tape_path, [VendorInputConfig(name="dd_hoa", type="dd_hoa", path=dd_path)]
     )
+    report_rows = _report_rows(report)
 
-    exit_code = main(["--config", str(config_path)])
-
-    captured = capsys.readouterr()
-    assert exit_code == 0
-    assert output_path.exists()
-    assert "QA Summary" in captured.out
-
-    workbook = load_workbook(output_path)
-    report_sheet = workbook["Sheet1"]
-
-    hoa_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA") + 1
-    hoa_payment_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA Monthly Payment") + 1
+    assert report_rows[0][_HOA_COL] == "Y"
+    assert report_rows[0][_HOA_PAYMENT_COL] == 125.0
 
-    assert report_sheet.cell(row=2, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=2, column=hoa_payment_col_idx).value == 125.0
-
-    assert report_sheet.cell(row=3, column=hoa_col_idx).value == "TBD"
+    assert report_rows[1][_HOA_COL] == "TBD"
     assert (
-        report_sheet.cell(row=3, column=hoa_payment_col_idx).value
+        report_rows[1][_HOA_PAYMENT_COL]
         == "Limited Review - please refer to URAR"
     )
 
     # Override applies even when a Limited Review row has no matched vendor HOA amount.
-    assert report_sheet.cell(row=4, column=hoa_col_idx).value == "TBD"
+    assert report_rows[2][_HOA_COL] == "TBD"
     assert (
-        report_sheet.cell(row=4, column=hoa_payment_col_idx).value
+        report_rows[2][_HOA_PAYMENT_COL]
         == "Limited Review - please refer to URAR"
     )
 
 
-def test_cli_consolidated_analytics_defaults_blank_matched_values_to_zero(
-    capsys: pytest.CaptureFixture[str],
+def _mock_collateral_sql_enrichment(
+    *,
+    tape_df: pd.DataFrame,
+    connection_string: str,
+    query_path: Path,
+) -> pd.DataFrame:
+    _ = tape_df, connection_string, query_path
+    return pd.DataFrame(
+        {
+            "loan_id": ["L1001", "L1002", "L1003"],
+            "Collateral ID": ["C1", "C2", "C3"],
+        }
+    )
+
+
+def test_build_report_consolidated_analytics_defaults_blank_matched_values_to_zero(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     tape_path = _write_tape_fixture_with_ids(
+        tmp_path,
         "run_cli.consolidated_default_zero.tape.synthetic.xlsx",
         ["L-1001", "L-1002", "L-1003"],
     )
-    template_path = _write_template_fixture("run_cli.consolidated_default_zero.template.synthetic.xlsx")
     consolidated_path = _write_consolidated_vendor_fixture(
+        tmp_path,
         "run_cli.consolidated_default_zero.vendor.synthetic.xlsx",
         [
             {"Loan ID": "C-1", "Monthly HOA Payment Amount": None},
@@ -472,84 +530,45 @@ def test_cli_consolidated_analytics_defaults_blank_matched_values_to_zero(
             {"Loan ID": "C-999", "Monthly HOA Payment Amount": "$50.00"},
         ],
     )
-    output_path = _TEST_TMP_DIR / f"run_cli.consolidated_default_zero.output.{uuid4().hex}.xlsx"
+    monkeypatch.setattr("hoa_report.run.run_sql_enrichment_query", _mock_collateral_sql_enrichment)
 
-    config_path = _write_config(
-        "run_cli.consolidated_default_zero.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendors": [
-                {
-                    "name": "consolidated_analytics",
-                    "type": "consolidated_analytics",
-                    "path": str(consolidated_path),
-                    "match_key": "collateral_id",
-                }
-            ],
-            "vendor_priority": ["consolidated_analytics"],
-            "output_path": str(output_path),
-            "run_sql": True,
-            "sql": {
-                "connection_string": (
-                    "mssql+pyodbc://@RTSQLGEN01/LOANDATA?"
-                    "driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
-                ),
-                "query_path": "sql/hoa_enrich.sql",
-            },
-        },
+    report = _build_report(
+        tape_path,
+        [
+            VendorInputConfig(
+                name="consolidated_analytics",
+                type="consolidated_analytics",
+                path=consolidated_path,
+                match_key="collateral_id",
+            )
+        ],
+        vendor_priority=["consolidated_analytics"],
+        run_sql=True,
     )
-
-    def _mock_run_sql_enrichment_query(
-        *,
-        tape_df: pd.DataFrame,
-        connection_string: str,
-        query_path: Path,
-    ) -> pd.DataFrame:
-        _ = tape_df, connection_string, query_path
-        return pd.DataFrame(
-            {
-                "loan_id": ["L1001", "L1002", "L1003"],
-                "Collateral ID": ["C1", "C2", "C3"],
-            }
-        )
-
-    monkeypatch.setattr("hoa_report.run.run_sql_enrichment_query", _mock_run_sql_enrichment_query)
-
-    exit_code = main(["--config", str(config_path)])
-
-    captured = capsys.readouterr()
-    assert exit_code == 0
-    assert output_path.exists()
-    assert "QA Summary" in captured.out
-
-    workbook = load_workbook(output_path)
-    report_sheet = workbook["Sheet1"]
-
-    hoa_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA") + 1
-    hoa_payment_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA Monthly Payment") + 1
+    report_rows = _report_rows(report)
 
     # Matched consolidated row has blank HOA dues in source, so output defaults to 0.0 / N.
-    assert report_sheet.cell(row=2, column=hoa_col_idx).value == "N"
-    assert report_sheet.cell(row=2, column=hoa_payment_col_idx).value == 0.0
+    assert report_rows[0][_HOA_COL] == "N"
+    assert report_rows[0][_HOA_PAYMENT_COL] == 0.0
 
-    assert report_sheet.cell(row=3, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=3, column=hoa_payment_col_idx).value == 220.0
+    assert report_rows[1][_HOA_COL] == "Y"
+    assert report_rows[1][_HOA_PAYMENT_COL] == 220.0
 
-    assert report_sheet.cell(row=4, column=hoa_col_idx).value in ("", None)
-    assert report_sheet.cell(row=4, column=hoa_payment_col_idx).value is None
+    assert report_rows[2][_HOA_COL] in ("", None)
+    assert report_rows[2][_HOA_PAYMENT_COL] is None
 
 
-def test_cli_runs_multi_vendor_with_collateral_id_mapping_and_priority(
-    capsys: pytest.CaptureFixture[str],
+def test_build_report_multi_vendor_with_collateral_id_mapping_and_priority(
     monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
 ) -> None:
     tape_path = _write_tape_fixture_with_ids(
+        tmp_path,
         "run_cli.multi_vendor.tape.synthetic.xlsx",
         ["L-1001", "L-1002", "L-1003"],
     )
-    template_path = _write_template_fixture("run_cli.multi_vendor.template.synthetic.xlsx")
     clayton_path = _write_clayton_vendor_fixture(
+        tmp_path,
         "run_cli.multi_vendor.clayton.synthetic.xlsx",
         [
             {"Loan Number": "L-1001", "HOA Monthly Premium Amount": "$125.00"},
@@ -557,6 +576,7 @@ def test_cli_runs_multi_vendor_with_collateral_id_mapping_and_priority(
         ],
     )
     consolidated_path = _write_consolidated_vendor_fixture(
+        tmp_path,
         "run_cli.multi_vendor.consolidated.synthetic.xlsx",
         [
             {"Loan ID": "C-2", "Monthly HOA Payment Amount": "$250.00"},
@@ -564,77 +584,65 @@ def test_cli_runs_multi_vendor_with_collateral_id_mapping_and_priority(
             {"Loan ID": "C-999", "Monthly HOA Payment Amount": "50"},
         ],
     )
-    output_path = _TEST_TMP_DIR / f"run_cli.multi_vendor.output.{uuid4().hex}.xlsx"
+    monkeypatch.setattr("hoa_report.run.run_sql_enrichment_query", _mock_collateral_sql_enrichment)
 
-    config_path = _write_config(
-        "run_cli.multi_vendor.config.json",
-        {
-            "tape_path": str(tape_path),
-            "template_path": str(template_path),
-            "vendors": [
-                {
-                    "name": "clayton",
-                    "type": "clayton",
-                    "path": str(clayton_path),
-                    "match_key": "loan_id",
-                },
-                {
-                    "name": "consolidated_analytics",
-                    "type": "consolidated_analytics",
-                    "path": str(consolidated_path),
-                    "match_key": "collateral_id",
-                },
-            ],
-            "vendor_priority": ["clayton", "consolidated_analytics"],
-            "output_path": str(output_path),
-            "run_sql": True,
-            "sql": {
-                "connection_string": (
-                    "mssql+pyodbc://@RTSQLGEN01/LOANDATA?"
-                    "driver=ODBC+Driver+17+for+SQL+Server&trusted_connection=yes"
-                ),
-                "query_path": "sql/hoa_enrich.sql",
-            },
-        },
+    report = _build_report(
+        tape_path,
+        [
+            VendorInputConfig(name="clayton", type="clayton", path=clayton_path),
+            VendorInputConfig(
+                name="consolidated_analytics",
+                type="consolidated_analytics",
+                path=consolidated_path,
+                match_key="collateral_id",
+            ),
+        ],
+        vendor_priority=["clayton", "consolidated_analytics"],
+        run_sql=True,
     )
+    report_rows = _report_rows(report)
 
-    def _mock_run_sql_enrichment_query(
-        *,
-        tape_df: pd.DataFrame,
-        connection_string: str,
-        query_path: Path,
-    ) -> pd.DataFrame:
-        _ = tape_df, connection_string, query_path
-        return pd.DataFrame(
-            {
-                "loan_id": ["L1001", "L1002", "L1003"],
-                "Collateral ID": ["C1", "C2", "C3"],
-            }
-        )
+    assert report_rows[0][_HOA_COL] == "Y"
+    assert report_rows[0][_HOA_PAYMENT_COL] == 125.0
 
-    monkeypatch.setattr("hoa_report.run.run_sql_enrichment_query", _mock_run_sql_enrichment_query)
+    # Clayton has higher priority and should not be overwritten by consolidated.
+    assert report_rows[1][_HOA_COL] == "Y"
+    assert report_rows[1][_HOA_PAYMENT_COL] == 300.0
 
-    exit_code = main(["--config", str(config_path)])
+    assert report_rows[2][_HOA_COL] == "N"
+    assert report_rows[2][_HOA_PAYMENT_COL] == 0.0
 
-    captured = capsys.readouterr()
-    assert exit_code == 0
-    assert output_path.exists()
-    assert "QA Summary" in captured.out
+    assert set(report.exceptions) == {"clayton", "consolidated_analytics"}
 
-    workbook = load_workbook(output_path)
-    report_sheet = workbook["Sheet1"]
 
-    hoa_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA") + 1
-    hoa_payment_col_idx = TEMPLATE_REPORT_COLUMNS.index("HOA Monthly Payment") + 1
+def test_cli_reports_build_failures_as_usage_errors(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    standard_tape_path: Path,
+    standard_template_path: Path,
+    vendor_a_path: Path,
+    tmp_path: Path,
+) -> None:
+    config_path = _write_config(
+        tmp_path,
+        "run_cli.build_failure.config.json",
+        _make_config(
+            tape=standard_tape_path,
+            template=standard_template_path,
+            vendors=[vendor_a_path],
+            output=tmp_path / "run_cli.build_failure.output.xlsx",
+        ),
+    )
 
-    assert report_sheet.cell(row=2, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=2, column=hoa_payment_col_idx).value == 125.0
+    def _raise_build_failure(config: InputConfig) -> ReportBuild:
+        raise ValueError(f"Vendor '{config.vendors[0].name}' failed: synthetic failure")
 
-    # Clayton has higher priority and should not be overwritten by consolidated.
-    assert report_sheet.cell(row=3, column=hoa_col_idx).value == "Y"
-    assert report_sheet.cell(row=3, column=hoa_payment_col_idx).value == 300.0
+    monkeypatch.setattr("hoa_report.run.build_report", _raise_build_failure)
 
-    assert report_sheet.cell(row=4, column=hoa_col_idx).value == "N"
-    assert report_sheet.cell(row=4, column=hoa_payment_col_idx).value == 0.0
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--config", str(config_path)])
 
-    assert set(workbook.sheetnames) == {"Sheet1", "QA Summary"}
+    captured = capsys.readouterr()
+    assert exc_info.value.code == 2
+    assert "Vendor 'example_vendor' failed: synthetic failure" in captured.err
+    assert not (tmp_path / "run_cli.build_failure.output.xlsx").exists()
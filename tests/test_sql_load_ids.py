@@ -14,12 +14,15 @@ class _MockCursor:
     def __init__(self) -> None:
         self.execute_calls: list[tuple[str, object | None]] = []
         self.executemany_calls: list[tuple[str, list[tuple[str]]]] = []
+        self.fast_executemany = False
+        self.fast_executemany_at_insert: list[bool] = []
 
     def execute(self, statement: str, params: object | None = None) -> None:
         self.execute_calls.append((statement, params))
 
     def executemany(self, statement: str, params_list: list[tuple[str]]) -> None:
         self.executemany_calls.append((statement, params_list))
+        self.fast_executemany_at_insert.append(self.fast_executemany)
 
 
 def test_load_ids_to_temp_table_normalizes_and_dedupes_loan_ids() -> None:
@@ -37,6 +40,18 @@ def test_load_ids_to_temp_table_normalizes_and_dedupes_loan_ids() -> None:
     insert_sql, params = cursor.executemany_calls[0]
     assert "INSERT INTO #tape_loan_ids (loan_id) VALUES (?)" in insert_sql
     assert params == [("L1001",), ("AB22",)]
+    assert cursor.fast_executemany_at_insert == [True]
+
+
+def test_load_ids_to_temp_table_inserts_in_bounded_batches() -> None:
+    tape_df = pd.DataFrame({"loan_id": [f"L-{index}" for index in range(2500)]})
+    cursor = _MockCursor()
+
+    loaded_ids = load_ids_to_temp_table(cursor, tape_df)
+
+    assert [len(params) for _, params in cursor.executemany_calls] == [1000, 1000, 500]
+    assert [loan_id for _, params in cursor.executemany_calls for (loan_id,) in params] == loaded_ids
+    assert loaded_ids[:2] == ["L0", "L1"]
 
 
 def test_validate_sql_enrichment_contract_rejects_duplicate_normalized_ids() -> None:
@@ -76,6 +91,47 @@ def test_merge_sql_enrichment_onto_tape_is_left_join_by_tape_population() -> Non
     assert merged["Bulk ID"].iloc[2] == "BULK-3"
 
 
+def test_merge_sql_enrichment_onto_tape_repeats_enrichment_for_duplicate_tape_ids() -> None:
+    tape_df = pd.DataFrame(
+        {"loan_id": ["LN-2", "LN-1", "ln2"], "tape_row": [1, 2, 3]},
+        index=[7, 7, 3],
+    )
+    enrichment_df = pd.DataFrame({"loan_id": ["LN1", "LN2"], "Units": [1, 4]})
+
+    merged = merge_sql_enrichment_onto_tape(tape_df, enrichment_df)
+
+    assert merged.index.tolist() == [0, 1, 2]
+    assert merged["loan_id"].tolist() == ["LN2", "LN1", "LN2"]
+    assert merged["tape_row"].tolist() == [1, 2, 3]
+    assert merged["Units"].tolist() == [4, 1, 4]
+    assert merged["Units"].dtype == "int64"
+
+
+def test_merge_sql_enrichment_onto_tape_sorted_inputs_match_unsorted_result() -> None:
+    tape_df = pd.DataFrame({"loan_id": ["LN1", "LN1", "LN2", "LN4", "LN5"], "tape_row": range(5)})
+    enrichment_df = pd.DataFrame({"loan_id": ["LN1", "LN3", "LN4", "LN5"], "Units": [1, 3, 4, 5]})
+
+    sorted_merge = merge_sql_enrichment_onto_tape(tape_df, enrichment_df)
+    shuffled_merge = merge_sql_enrichment_onto_tape(tape_df, enrichment_df.iloc[::-1])
+
+    assert sorted_merge["Units"].tolist()[:2] == [1.0, 1.0]
+    assert pd.isna(sorted_merge["Units"].iloc[2])
+    assert sorted_merge["Units"].tolist()[3:] == [4.0, 5.0]
+    pd.testing.assert_frame_equal(sorted_merge, shuffled_merge)
+
+
+def test_merge_sql_enrichment_onto_tape_handles_empty_enrichment() -> None:
+    tape_df = pd.DataFrame({"loan_id": ["LN-1", "LN-2"], "tape_flag": ["A", "B"]}, index=[4, 9])
+    enrichment_df = pd.DataFrame({"loan_id": [], "Bulk ID": [], "Seller": []}, dtype=object)
+
+    merged = merge_sql_enrichment_onto_tape(tape_df, enrichment_df)
+
+    assert merged.columns.tolist() == ["loan_id", "tape_flag", "Bulk ID", "Seller"]
+    assert merged.index.tolist() == [0, 1]
+    assert merged["loan_id"].tolist() == ["LN1", "LN2"]
+    assert merged[["Bulk ID", "Seller"]].isna().all().all()
+
+
 def test_merge_sql_enrichment_onto_tape_rejects_column_collisions() -> None:
     tape_df = pd.DataFrame({"loan_id": ["LN1"], "seller": ["Tape Seller"]})
     enrichment_df = pd.DataFrame({"loan_id": ["LN1"], "seller": ["SQL Seller"]})
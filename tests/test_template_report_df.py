@@ -88,6 +88,20 @@ def test_build_template_report_df_supports_template_named_columns_and_money_stri
     assert report_df["rwtLoanNo"].isna().all()
 
 
+def test_build_template_report_df_hoa_flag_parses_mixed_money_values() -> None:
+    loan_master_df_enriched = pd.DataFrame(
+        {
+            "loan_id": ["L1", "L2", "L3", "L4", "L5"],
+            "hoa_monthly_dues_amount": pd.Series(["$ 2,000", 75, "n/a", "$0.00", None], dtype=object),
+        }
+    )
+
+    report_df = build_template_report_df(loan_master_df_enriched)
+
+    assert report_df["HOA"].tolist() == ["Y", "Y", "", "N", ""]
+    assert report_df["HOA Monthly Payment"].tolist() == ["$ 2,000", 75, "n/a", "$0.00", None]
+
+
 def test_build_template_report_df_prefers_loan_id_when_semt_id_column_is_blank() -> None:
     loan_master_df_enriched = pd.DataFrame(
         {
@@ -9,8 +9,6 @@ from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from hoa_report.engine import TEMPLATE_REPORT_COLUMNS
 from hoa_report.io import write_report_from_template
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
-
 
 def _build_generated_template(path: Path) -> None:
     workbook = Workbook()
@@ -42,19 +40,18 @@ def _build_generated_template(path: Path) -> None:
 
 
 def _count_non_blank_rows(sheet, start_row: int, col_count: int) -> int:
-    count = 0
-    for row_idx in range(start_row, sheet.max_row + 1):
-        values = [sheet.cell(row=row_idx, column=col_idx).value for col_idx in range(1, col_count + 1)]
-        if any(value is not None and str(value).strip() for value in values):
-            count += 1
-    return count
+    return sum(
+        1
+        for values in sheet.iter_rows(min_row=start_row, max_col=col_count, values_only=True)
+        if any(value is not None and str(value).strip() for value in values)
+    )
 
 
 def test_write_report_from_template_keeps_only_main_and_qa_sheets_and_preserves_header_and_row_count(
+    tmp_path: Path,
 ) -> None:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    template_path = _TEST_TMP_DIR / "template.generated.writer.xlsx"
-    output_path = _TEST_TMP_DIR / "report.generated.writer.xlsx"
+    template_path = tmp_path / "template.generated.writer.xlsx"
+    output_path = tmp_path / "report.generated.writer.xlsx"
     _build_generated_template(template_path)
 
     report_rows: list[dict[str, object]] = []
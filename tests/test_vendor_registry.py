@@ -7,15 +7,12 @@ import pytest
 
 from hoa_report.extractors import extract_vendor_file, list_vendor_extractors
 from hoa_report.models import HOA_EXTRACTOR_COLUMNS
+from tests import _tiny_xlsx as tiny_xlsx
 
-_TEST_TMP_DIR = Path("data/_test_tmp")
 
-
-def _write_synthetic_vendor_fixture(filename: str, df: pd.DataFrame) -> Path:
-    _TEST_TMP_DIR.mkdir(parents=True, exist_ok=True)
-    fixture_path = _TEST_TMP_DIR / filename
-    df.to_excel(fixture_path, index=False)
-    return fixture_path
+def _write_synthetic_vendor_fixture(tmp_path: Path, filename: str, df: pd.DataFrame) -> Path:
+    rows = df.itertuples(index=False, name=None)
+    return tiny_xlsx.write(tmp_path / filename, list(df.columns), rows)
 
 
 def test_registry_contains_example_vendor_extractor() -> None:
@@ -24,7 +21,9 @@ def test_registry_contains_example_vendor_extractor() -> None:
     assert "consolidated_analytics" in list_vendor_extractors()
 
 
-def test_extract_vendor_file_normalizes_ids_enforces_uniqueness_and_canonical_schema() -> None:
+def test_extract_vendor_file_normalizes_ids_enforces_uniqueness_and_canonical_schema(
+    tmp_path: Path,
+) -> None:
     raw_df = pd.DataFrame(
         {
             "Loan Number": [" 1001.0 ", "AB-22"],
@@ -33,7 +32,7 @@ def test_extract_vendor_file_normalizes_ids_enforces_uniqueness_and_canonical_sc
             "Ignored": ["x", "y"],
         }
     )
-    fixture_path = _write_synthetic_vendor_fixture("vendor.synthetic.xlsx", raw_df)
+    fixture_path = _write_synthetic_vendor_fixture(tmp_path, "vendor.synthetic.xlsx", raw_df)
 
     extracted = extract_vendor_file("example_vendor", fixture_path)
 
@@ -46,22 +45,22 @@ def test_extract_vendor_file_normalizes_ids_enforces_uniqueness_and_canonical_sc
     assert extracted["hoa_transfer_fee_amount"].isna().all()
 
 
-def test_extract_vendor_file_raises_on_duplicate_normalized_ids() -> None:
+def test_extract_vendor_file_raises_on_duplicate_normalized_ids(tmp_path: Path) -> None:
     raw_df = pd.DataFrame(
         {
             "Loan Number": ["AB-22", "ab22"],
             "Monthly Dues": [100.0, 200.0],
         }
     )
-    fixture_path = _write_synthetic_vendor_fixture("vendor.duplicates.synthetic.xlsx", raw_df)
+    fixture_path = _write_synthetic_vendor_fixture(tmp_path, "vendor.duplicates.synthetic.xlsx", raw_df)
 
     with pytest.raises(ValueError, match=r"Duplicate vendor loan IDs detected"):
         extract_vendor_file("example_vendor", fixture_path)
 
 
-def test_extract_vendor_file_raises_for_unknown_vendor_type() -> None:
+def test_extract_vendor_file_raises_for_unknown_vendor_type(tmp_path: Path) -> None:
     raw_df = pd.DataFrame({"Loan Number": ["1001"]})
-    fixture_path = _write_synthetic_vendor_fixture("vendor.unknown.synthetic.xlsx", raw_df)
+    fixture_path = _write_synthetic_vendor_fixture(tmp_path, "vendor.unknown.synthetic.xlsx", raw_df)
 
     with pytest.raises(KeyError, match=r"Unknown vendor extractor"):
         extract_vendor_file("missing_vendor", fixture_path)